@@ -10,7 +10,7 @@ Does NOT: Build prompts, format context, manage configuration.
 
 import boto3
 import json
-from typing import Dict
+from typing import Callable, Dict
 import logging
 
 from ..utilities.response_cleaner import clean_llm_response
@@ -204,6 +204,111 @@ class BedrockClient:
             raise
     
 
+    def invoke_stream(
+        self,
+        system: str,
+        user: str,
+        on_text: Callable[[str], None]
+    ) -> Dict:
+        """
+        Streaming variant of invoke() - same request, same return dict.
+        
+        Text is pushed to on_text as soon as each line of the answer is
+        complete. The response cleaner works line by line, so cleaning each
+        finished line gives exactly the text invoke() would return; the
+        pieces passed to on_text concatenate to the final 'content'.
+        
+        Args:
+            system: System prompt (instructions, role definition)
+            user: User prompt (assembled context + query)
+            on_text: Called with each cleaned chunk (whole lines, '\n'-terminated
+                     except possibly the last)
+            
+        Returns:
+            Same structure as invoke()
+            
+        Raises:
+            Exception: On AWS API errors (caller should handle)
+        """
+        body = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "system": system,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": user
+                }
+            ]
+        }
+        
+        try:
+            response = self.client.invoke_model_with_response_stream(
+                modelId=self.model_id,
+                body=json.dumps(body)
+            )
+            
+            input_tokens = 0
+            output_tokens = 0
+            stop_reason = 'unknown'
+            pieces = []
+            pending = ''  # raw text of the line still being generated
+            
+            for event in response['body']:
+                chunk = event.get('chunk')
+                if chunk is None:
+                    continue
+                data = json.loads(chunk['bytes'])
+                kind = data.get('type')
+                
+                if kind == 'content_block_delta':
+                    pending += data['delta'].get('text', '')
+                    if '\n' in pending:
+                        done, pending = pending.rsplit('\n', 1)
+                        piece = clean_llm_response(done) + '\n'
+                        pieces.append(piece)
+                        on_text(piece)
+                
+                elif kind == 'message_start':
+                    input_tokens = data['message']['usage'].get('input_tokens', 0)
+                
+                elif kind == 'message_delta':
+                    stop_reason = data['delta'].get('stop_reason') or stop_reason
+                    output_tokens = data.get('usage', {}).get('output_tokens', output_tokens)
+            
+            if pending:
+                piece = clean_llm_response(pending)
+                pieces.append(piece)
+                on_text(piece)
+            
+            content = ''.join(pieces)
+            cost = self._calculate_cost(input_tokens, output_tokens)
+            
+            logger.info(
+                f"Bedrock stream success: "
+                f"input={input_tokens} tokens, "
+                f"output={output_tokens} tokens, "
+                f"cost=${cost:.4f}, "
+                f"stop_reason={stop_reason}"
+            )
+            
+            return {
+                'content': content,
+                'usage': {
+                    'input_tokens': input_tokens,
+                    'output_tokens': output_tokens
+                },
+                'cost': cost,
+                'model_id': self.model_id,
+                'stop_reason': stop_reason
+            }
+            
+        except Exception as e:
+            logger.error(f"Bedrock stream error: {e}", exc_info=True)
+            raise
+    
+
     def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """
         Calculate total cost from token usage.
@@ -21,6 +21,7 @@ Usage:
         tracker.log_artifacts(system_prompt=prompt, context=ctx, response=resp)
 """
 
+import hashlib
 import json
 import logging
 import tempfile
@@ -29,13 +30,24 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import mlflow
 #from mlflow.tracking import MlflowClient
 
+# orjson is optional: faster serialization of large response artifacts
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# (tracking_uri, experiment_name, prompt digest) -> run_id of the run that
+# holds the uploaded text. Later runs in this process only tag the hash and
+# that run_id instead of re-uploading the same prompt.
+_LOGGED_PROMPTS: Dict[Tuple[str, str, bytes], str] = {}
+
 
 # ============================================================================
 # CONFIGURATION
@@ -127,7 +139,8 @@ class FinRAGTracker:
         # Set tracking URI
         tracking_path = self.model_root / self.config.tracking_uri
         tracking_uri = tracking_path.as_uri()
-        mlflow.set_tracking_uri(str(tracking_uri))
+        self.tracking_uri = str(tracking_uri)
+        mlflow.set_tracking_uri(self.tracking_uri)
         logger.info(f"MLflow tracking URI: {tracking_uri}")
         
         # Set/create experiment
@@ -174,6 +187,17 @@ class FinRAGTracker:
         mlflow.set_experiment(self.experiment_name)
     
     
+    def activate(self):
+        """
+        Re-point global MLflow state at this tracker's store and experiment.
+        
+        MLflow keeps the tracking URI and active experiment process-wide, so a
+        reused tracker must call this if another tracker was used in between.
+        """
+        mlflow.set_tracking_uri(self.tracking_uri)
+        mlflow.set_experiment(self.experiment_name)
+    
+    
     # ========================================================================
     # RUN LIFECYCLE
     # ========================================================================
@@ -501,6 +525,13 @@ class FinRAGTracker:
         """
         Log artifacts (prompts, context, response).
         
+        All artifacts are staged in one temp directory and uploaded with a
+        single log_artifacts call (one round trip on remote artifact stores).
+        
+        The system prompt is uploaded once per tracking URI and experiment;
+        every run gets a system_prompt_hash tag plus a system_prompt_run_id
+        tag naming the run that holds the text.
+        
         Args:
             system_prompt: System prompt text
             user_prompt: User prompt (with context)
@@ -508,6 +539,8 @@ class FinRAGTracker:
             full_response: Complete response dict from answer_query()
             query: Original user query
         """
+        new_prompt_key = None
+        
         with tempfile.TemporaryDirectory() as tmpdir:
             tmppath = Path(tmpdir)
             
@@ -517,9 +550,23 @@ class FinRAGTracker:
                 prompts_dir.mkdir(exist_ok=True)
                 
                 if system_prompt:
-                    (prompts_dir / "system_prompt.txt").write_text(
-                        system_prompt, encoding="utf-8"
-                    )
+                    digest = hashlib.blake2b(
+                        system_prompt.encode("utf-8"), digest_size=16
+                    ).digest()
+                    mlflow.set_tag("system_prompt_hash", digest.hex())
+                    
+                    # Upload only the first time this prompt is seen per
+                    # tracking store + experiment; recorded once the upload
+                    # below succeeds.
+                    prompt_key = (mlflow.get_tracking_uri(), self.experiment_name, digest)
+                    owner_run_id = _LOGGED_PROMPTS.get(prompt_key)
+                    if owner_run_id is None:
+                        (prompts_dir / "system_prompt.txt").write_text(
+                            system_prompt, encoding="utf-8"
+                        )
+                        new_prompt_key = prompt_key
+                    else:
+                        mlflow.set_tag("system_prompt_run_id", owner_run_id)
                 
                 if user_prompt:
                     # Truncate if too large
@@ -535,8 +582,6 @@ class FinRAGTracker:
                     (prompts_dir / "original_query.txt").write_text(
                         query, encoding="utf-8"
                     )
-                
-                mlflow.log_artifacts(str(prompts_dir), "prompts")
             
             # Log context
             if self.config.log_context and assembled_context:
@@ -552,20 +597,34 @@ class FinRAGTracker:
                 (context_dir / "assembled_context.txt").write_text(
                     ctx_text, encoding="utf-8"
                 )
-                
-                mlflow.log_artifacts(str(context_dir), "context")
             
             # Log response
             if self.config.log_response and full_response:
                 response_dir = tmppath / "response"
                 response_dir.mkdir(exist_ok=True)
                 
-                (response_dir / "full_response.json").write_text(
-                    json.dumps(full_response, indent=2, default=str),
-                    encoding="utf-8"
-                )
-                
-                mlflow.log_artifacts(str(response_dir), "response")
+                response_path = response_dir / "full_response.json"
+                if orjson is not None:
+                    response_path.write_bytes(orjson.dumps(
+                        full_response,
+                        default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                    ))
+                else:
+                    response_path.write_text(
+                        json.dumps(full_response, indent=2, default=str),
+                        encoding="utf-8"
+                    )
+            
+            # Single upload for everything staged above; subdirectories keep
+            # the prompts/ context/ response/ artifact layout.
+            if any(p.is_file() for p in tmppath.rglob("*")):
+                mlflow.log_artifacts(str(tmppath))
+            
+            if new_prompt_key is not None:
+                run_id = mlflow.active_run().info.run_id
+                mlflow.set_tag("system_prompt_run_id", run_id)
+                _LOGGED_PROMPTS[new_prompt_key] = run_id
         
         logger.debug("Logged artifacts to MLflow")
     
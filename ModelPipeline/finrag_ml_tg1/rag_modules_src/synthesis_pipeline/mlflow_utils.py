@@ -14,7 +14,9 @@ Usage:
         extract_retrieval_metrics,
         extract_llm_metrics,
         extract_all_metrics,
-        run_with_mlflow_tracking
+        extract_all_metrics_flat,
+        run_with_mlflow_tracking,
+        run_many_with_mlflow_tracking
     )
     
     # Option 1: Extract metrics manually
@@ -26,16 +28,76 @@ Usage:
         model_root=model_root,
         experiment_name="FinRAG-Synthesis"
     )
+    
+    # Option 3: Sweep many queries (tracker/config resolved once)
+    results, run_ids, columns = run_many_with_mlflow_tracking(
+        queries=[...],
+        model_root=model_root
+    )
 """
 
 import logging
+import re
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+# Numba is optional: JIT line counter for very large kpi_block strings
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+if TYPE_CHECKING:
+    from finrag_ml_tg1.rag_modules_src.synthesis_pipeline.mlflow_tracker import FinRAGTracker
 
 logger = logging.getLogger(__name__)
 
+# KPI data line: contains ':' and is not a '═' banner separator
+_KPI_LINE_RE = re.compile(r'^(?!═)[^\n]*:[^\n]*$', re.MULTILINE)
+
+# Shared read-only default for missing metadata sections (no per-call {} allocs)
+_EMPTY = MappingProxyType({})
+
+# Keys in metric_result that may hold row data, in priority order
+_RESULT_KEYS = ('data', 'results', 'rows', 'metrics', 'records')
+
+# Below this size the compiled regex is already fast enough
+_NUMBA_MIN_BYTES = 16_384
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _count_kpi_lines(buf):
+        """
+        Count UTF-8 lines that contain ':' and do not start with '═' (E2 95 90).
+        
+        Same rule as _KPI_LINE_RE, as a single pass over the encoded bytes.
+        """
+        count = 0
+        n = buf.shape[0]
+        line_start = 0
+        saw_colon = False
+        for i in range(n + 1):
+            if i == n or buf[i] == 10:  # end of buffer or '\n'
+                if saw_colon:
+                    is_banner = (
+                        line_start + 2 < n
+                        and buf[line_start] == 0xE2
+                        and buf[line_start + 1] == 0x95
+                        and buf[line_start + 2] == 0x90
+                    )
+                    if not is_banner:
+                        count += 1
+                line_start = i + 1
+                saw_colon = False
+            elif buf[i] == 58:  # ':'
+                saw_colon = True
+        return count
+
 
 # ============================================================================
 # DATA CLASSES FOR EXTRACTED METRICS
@@ -128,6 +190,25 @@ class PipelineMetrics:
 # METRIC EXTRACTION FUNCTIONS
 # ============================================================================
 
+# EntityExtractionResult class, resolved on first use (entity_adapter pulls in
+# loaders, so it is not imported at module load). False = unavailable.
+_ENTITY_TYPE: Any = None
+
+
+def _get_entity_type() -> Optional[type]:
+    """Return EntityExtractionResult, importing it once."""
+    global _ENTITY_TYPE
+    if _ENTITY_TYPE is None:
+        try:
+            from finrag_ml_tg1.rag_modules_src.entity_adapter.entity_adapter import (
+                EntityExtractionResult
+            )
+            _ENTITY_TYPE = EntityExtractionResult
+        except ImportError:
+            _ENTITY_TYPE = False
+    return _ENTITY_TYPE or None
+
+
 def extract_retrieval_metrics(context_metadata: Dict[str, Any]) -> RetrievalMetrics:
     """
     Extract retrieval metrics from context_metadata.
@@ -154,25 +235,39 @@ def extract_retrieval_metrics(context_metadata: Dict[str, Any]) -> RetrievalMetr
     sections_set = set()
     
     # ========================================================================
-    # Extract from KPI entities (EntityExtractionResult object)
+    # Extract from KPI + RAG entities (EntityExtractionResult objects)
     # ========================================================================
-    kpi_entities = context_metadata.get('kpi_entities')
-    if kpi_entities is not None:
+    entity_type = _get_entity_type()
+    
+    for label, entities in (
+        ('KPI', context_metadata.get('kpi_entities')),
+        ('RAG', context_metadata.get('rag_entities')),
+    ):
+        if entities is None:
+            continue
+        
+        if entity_type is not None and isinstance(entities, entity_type):
+            # Known shape: direct attribute access, one handler for the block
+            #   companies.tickers, years.years and sections are all sets/lists
+            try:
+                tickers_set.update(entities.companies.tickers or ())
+                years_set.update(entities.years.years or ())
+                sections_set.update(entities.sections or ())
+            except TypeError as e:
+                logger.warning(f"Could not extract {label} entity metrics: {e}")
+            continue
+        
+        # Duck-typed fallback (mocks, dict-like stand-ins): getattr defaults,
+        # no exception raised for missing attributes
+        tickers = getattr(getattr(entities, 'companies', None), 'tickers', None)
+        years = getattr(getattr(entities, 'years', None), 'years', None)
+        sections = getattr(entities, 'sections', None)
         try:
-            # EntityExtractionResult.companies.tickers is a set
-            if hasattr(kpi_entities, 'companies') and hasattr(kpi_entities.companies, 'tickers'):
-                tickers_set.update(kpi_entities.companies.tickers or [])
-            
-            # EntityExtractionResult.years.years is a set
-            if hasattr(kpi_entities, 'years') and hasattr(kpi_entities.years, 'years'):
-                years_set.update(kpi_entities.years.years or [])
-            
-            # EntityExtractionResult.sections is a set
-            if hasattr(kpi_entities, 'sections'):
-                sections_set.update(kpi_entities.sections or [])
-                
-        except (AttributeError, TypeError) as e:
-            logger.warning(f"Could not extract KPI entity metrics: {e}")
+            tickers_set.update(tickers or ())
+            years_set.update(years or ())
+            sections_set.update(sections or ())
+        except TypeError as e:
+            logger.warning(f"Could not extract {label} entity metrics: {e}")
     
     # ========================================================================
     # Get KPI count from metric_result or estimate from kpi_block
@@ -182,13 +277,13 @@ def extract_retrieval_metrics(context_metadata: Dict[str, Any]) -> RetrievalMetr
         try:
             if isinstance(metric_result, dict):
                 # Try common keys where row data might be stored
-                for key in ['data', 'results', 'rows', 'metrics', 'records']:
-                    if key in metric_result and isinstance(metric_result[key], (list, dict)):
-                        metrics.kpi_count = len(metric_result[key])
-                        break
-                else:
-                    # Fallback: count top-level items
-                    metrics.kpi_count = len(metric_result)
+                kpi_count = next(
+                    (len(metric_result[k]) for k in _RESULT_KEYS
+                     if isinstance(metric_result.get(k), (list, dict))),
+                    None
+                )
+                # Fallback: count top-level items
+                metrics.kpi_count = len(metric_result) if kpi_count is None else kpi_count
             elif isinstance(metric_result, list):
                 metrics.kpi_count = len(metric_result)
         except (TypeError, AttributeError) as e:
@@ -198,27 +293,11 @@ def extract_retrieval_metrics(context_metadata: Dict[str, Any]) -> RetrievalMetr
     if metrics.kpi_count == 0:
         kpi_block = context_metadata.get('kpi_block', '')
         if kpi_block:
-            data_lines = [line for line in kpi_block.split('\n') 
-                          if line.strip() and not line.startswith('═') and ':' in line]
-            metrics.kpi_count = len(data_lines)
-    
-    # ========================================================================
-    # Extract from RAG entities (EntityExtractionResult object)
-    # ========================================================================
-    rag_entities = context_metadata.get('rag_entities')
-    if rag_entities is not None:
-        try:
-            if hasattr(rag_entities, 'companies') and hasattr(rag_entities.companies, 'tickers'):
-                tickers_set.update(rag_entities.companies.tickers or [])
-            
-            if hasattr(rag_entities, 'years') and hasattr(rag_entities.years, 'years'):
-                years_set.update(rag_entities.years.years or [])
-            
-            if hasattr(rag_entities, 'sections'):
-                sections_set.update(rag_entities.sections or [])
-                
-        except (AttributeError, TypeError) as e:
-            logger.warning(f"Could not extract RAG entity metrics: {e}")
+            if numba is not None and len(kpi_block) >= _NUMBA_MIN_BYTES:
+                buf = np.frombuffer(kpi_block.encode('utf-8'), dtype=np.uint8)
+                metrics.kpi_count = int(_count_kpi_lines(buf))
+            else:
+                metrics.kpi_count = sum(1 for _ in _KPI_LINE_RE.finditer(kpi_block))
     
     # ========================================================================
     # Extract RAG count from retrieval_bundle
@@ -236,26 +315,32 @@ def extract_retrieval_metrics(context_metadata: Dict[str, Any]) -> RetrievalMetr
     # ========================================================================
     # Finalize: deduplicate and sort
     # ========================================================================
-    metrics.tickers = sorted(list(tickers_set))
-    metrics.years = sorted([int(y) for y in years_set if y])
-    metrics.sections = sorted(list(sections_set))
+    metrics.tickers = sorted(tickers_set)
+    metrics.years = sorted(int(y) for y in years_set if y)
+    metrics.sections = sorted(sections_set)
     
     return metrics
 
 
-def extract_llm_metrics(result: Dict[str, Any]) -> LLMMetrics:
+def extract_llm_metrics(
+    result: Dict[str, Any],
+    metadata: Optional[Dict[str, Any]] = None
+) -> LLMMetrics:
     """
     Extract LLM metrics from pipeline result.
     
     Args:
         result: Result dict from answer_query()
+        metadata: Pre-fetched result['metadata'] (optional; avoids re-reading it)
     
     Returns:
         LLMMetrics dataclass with extracted values
     """
     metrics = LLMMetrics()
     
-    llm_meta = result.get('metadata', {}).get('llm', {})
+    if metadata is None:
+        metadata = result.get('metadata') or _EMPTY
+    llm_meta = metadata.get('llm') or _EMPTY
     
     if llm_meta:
         metrics.model_id = llm_meta.get('model_id', '')
@@ -268,19 +353,25 @@ def extract_llm_metrics(result: Dict[str, Any]) -> LLMMetrics:
     return metrics
 
 
-def extract_context_metrics(result: Dict[str, Any]) -> ContextMetrics:
+def extract_context_metrics(
+    result: Dict[str, Any],
+    metadata: Optional[Dict[str, Any]] = None
+) -> ContextMetrics:
     """
     Extract context metrics from pipeline result.
     
     Args:
         result: Result dict from answer_query()
+        metadata: Pre-fetched result['metadata'] (optional; avoids re-reading it)
     
     Returns:
         ContextMetrics dataclass with extracted values
     """
     metrics = ContextMetrics()
     
-    ctx_meta = result.get('metadata', {}).get('context', {})
+    if metadata is None:
+        metadata = result.get('metadata') or _EMPTY
+    ctx_meta = metadata.get('context') or _EMPTY
     
     if ctx_meta:
         metrics.context_length = ctx_meta.get('context_length', 0)
@@ -316,13 +407,15 @@ def extract_all_metrics(
     status = "failed" if is_error else "success"
     error_message = result.get('error') if is_error else None
     
+    meta = result.get('metadata') or _EMPTY
+    
     # Extract retrieval metrics
     if context_metadata:
         retrieval = extract_retrieval_metrics(context_metadata)
     else:
         # Try to extract from result metadata if context_metadata not provided
         retrieval = RetrievalMetrics()
-        ret_meta = result.get('metadata', {}).get('retrieval', {})
+        ret_meta = meta.get('retrieval') or _EMPTY
         if ret_meta:
             retrieval.kpi_count = ret_meta.get('kpi_count', 0)
             retrieval.rag_count = ret_meta.get('rag_count', 0)
@@ -332,18 +425,195 @@ def extract_all_metrics(
     
     return PipelineMetrics(
         retrieval=retrieval,
-        llm=extract_llm_metrics(result),
-        context=extract_context_metrics(result),
+        llm=extract_llm_metrics(result, metadata=meta),
+        context=extract_context_metrics(result, metadata=meta),
         latency_seconds=latency_seconds,
         status=status,
         error_message=error_message
     )
 
 
+# (flat key, source key, default) for the flat extractor
+_LLM_FLAT_KEYS = (
+    ('llm.model_id', 'model_id', ''),
+    ('llm.input_tokens', 'input_tokens', 0),
+    ('llm.output_tokens', 'output_tokens', 0),
+    ('llm.total_tokens', 'total_tokens', 0),
+    ('llm.cost_usd', 'cost', 0.0),
+    ('llm.stop_reason', 'stop_reason', ''),
+)
+_CONTEXT_FLAT_KEYS = (
+    ('context.context_length', 'context_length', 0),
+    ('context.kpi_included', 'kpi_included', False),
+    ('context.rag_included', 'rag_included', False),
+)
+_RETRIEVAL_FLAT_KEYS = (
+    ('retrieval.kpi_count', 'kpi_count', 0),
+    ('retrieval.rag_count', 'rag_count', 0),
+)
+_RETRIEVAL_FLAT_LISTS = (
+    ('retrieval.tickers', 'tickers'),
+    ('retrieval.years', 'years'),
+    ('retrieval.sections', 'sections'),
+)
+
+
+def extract_all_metrics_flat(
+    result: Dict[str, Any],
+    context_metadata: Optional[Dict[str, Any]] = None,
+    latency_seconds: float = 0.0,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Flat-dict variant of extract_all_metrics.
+    
+    Reads result['metadata'] directly into one dict keyed "retrieval.kpi_count",
+    "llm.input_tokens", "context.answer_length", ... without building the
+    Retrieval/LLM/Context/PipelineMetrics dataclasses. Intended for callers
+    that only forward scalars (MLflow, monitoring sinks).
+    
+    Args:
+        result: Result dict from answer_query()
+        context_metadata: Optional metadata from build_combined_context()
+        latency_seconds: Total pipeline latency
+        metadata: Pre-fetched result['metadata'] (optional; avoids re-reading it)
+    
+    Returns:
+        Flat dict of metric name -> value (same values as extract_all_metrics)
+    """
+    error = result.get('error')
+    meta = metadata if metadata is not None else (result.get('metadata') or _EMPTY)
+    out: Dict[str, Any] = {}
+    
+    # Retrieval
+    if context_metadata:
+        # Entity walking lives in extract_retrieval_metrics; reuse it
+        ret = extract_retrieval_metrics(context_metadata)
+        out['retrieval.kpi_count'] = ret.kpi_count
+        out['retrieval.rag_count'] = ret.rag_count
+        out['retrieval.tickers'] = ret.tickers
+        out['retrieval.years'] = ret.years
+        out['retrieval.sections'] = ret.sections
+    else:
+        ret_meta = meta.get('retrieval') or _EMPTY
+        for key, src, default in _RETRIEVAL_FLAT_KEYS:
+            out[key] = ret_meta.get(src, default)
+        for key, src in _RETRIEVAL_FLAT_LISTS:
+            out[key] = ret_meta.get(src) or []
+    
+    # LLM
+    llm_meta = meta.get('llm') or _EMPTY
+    for key, src, default in _LLM_FLAT_KEYS:
+        out[key] = llm_meta.get(src, default)
+    
+    # Context
+    ctx_meta = meta.get('context') or _EMPTY
+    for key, src, default in _CONTEXT_FLAT_KEYS:
+        out[key] = ctx_meta.get(src, default)
+    answer = result.get('answer')
+    out['context.answer_length'] = len(answer) if answer else 0
+    
+    out['latency_seconds'] = latency_seconds
+    out['status'] = "failed" if error is not None else "success"
+    out['error_message'] = error
+    
+    return out
+
+
 # ============================================================================
 # MLFLOW INTEGRATION WRAPPER
 # ============================================================================
 
+# Trackers keyed by (experiment_name, model_root, environment); building one
+# resolves the experiment and bootstraps the tracking store.
+_TRACKER_CACHE: Dict[Tuple[str, str, str], "FinRAGTracker"] = {}
+_active_tracker_key: Optional[Tuple[str, str, str]] = None
+
+
+def _get_tracker(
+    experiment_name: str,
+    model_root: Path,
+    environment: str
+) -> "FinRAGTracker":
+    """Return a cached tracker for this configuration, creating it on first use."""
+    global _active_tracker_key
+    from finrag_ml_tg1.rag_modules_src.synthesis_pipeline.mlflow_tracker import create_tracker
+    
+    key = (experiment_name, str(model_root), environment)
+    tracker = _TRACKER_CACHE.get(key)
+    
+    if tracker is None:
+        tracker = create_tracker(
+            experiment_name=experiment_name,
+            model_root=model_root,
+            environment=environment
+        )
+        _TRACKER_CACHE[key] = tracker
+    elif _active_tracker_key != key:
+        # Another tracker moved the global MLflow state since this one was used
+        tracker.activate()
+    
+    _active_tracker_key = key
+    return tracker
+
+
+def _log_result_to_run(
+    tracker: "FinRAGTracker",
+    query: str,
+    result: Dict[str, Any],
+    latency: float
+) -> Optional[Dict[str, Any]]:
+    """
+    Log one answer_query() result to the tracker's active run.
+    
+    Shared by run_with_mlflow_tracking and run_many_with_mlflow_tracking.
+    
+    Returns:
+        The extract_all_metrics_flat dict, or None if the result is an error
+        (only latency is logged then)
+    """
+    tracker.log_latency(total=latency)
+    
+    if result.get('error') is not None:
+        return None
+    
+    # Flat extraction: only scalars are forwarded, no dataclasses needed
+    meta = result.get('metadata') or _EMPTY
+    flat = extract_all_metrics_flat(result, latency_seconds=latency, metadata=meta)
+    
+    # LLM metrics
+    tracker.log_llm_metrics(
+        input_tokens=flat['llm.input_tokens'],
+        output_tokens=flat['llm.output_tokens'],
+        cost=flat['llm.cost_usd'],
+        model_id=flat['llm.model_id']
+    )
+    
+    # Context metrics
+    tracker.log_context_metrics(
+        context_length=flat['context.context_length'],
+        answer_length=flat['context.answer_length']
+    )
+    
+    # Retrieval metrics (from result if available)
+    if meta.get('retrieval'):
+        tracker.log_retrieval_metrics(
+            kpi_count=flat['retrieval.kpi_count'],
+            rag_count=flat['retrieval.rag_count'],
+            tickers=flat['retrieval.tickers'],
+            years=flat['retrieval.years'],
+            sections=flat['retrieval.sections']
+        )
+    
+    # Log artifacts
+    tracker.log_artifacts(
+        query=query,
+        full_response=result
+    )
+    
+    return flat
+
+
 def run_with_mlflow_tracking(
     query: str,
     model_root: Path,
@@ -363,17 +633,13 @@ def run_with_mlflow_tracking(
     """
     # Import here to avoid circular imports
     from finrag_ml_tg1.rag_modules_src.synthesis_pipeline.orchestrator import answer_query
-    from finrag_ml_tg1.rag_modules_src.synthesis_pipeline.mlflow_tracker import (
-        create_tracker,
-        FinRAGTracker
-    )
     
     # Load model config for logging parameters
     model_config = _load_model_config(model_root, model_key)
     resolved_model_key = model_config.get('_resolved_key', model_key or 'default')
     
-    # Create tracker
-    tracker = create_tracker(
+    # Reuse tracker across calls (only start_run cost remains per query)
+    tracker = _get_tracker(
         experiment_name=experiment_name,
         model_root=model_root,
         environment=environment
@@ -407,50 +673,111 @@ def run_with_mlflow_tracking(
             export_response=export_response
         )
         
-        # Calculate latency
+        # Calculate latency, then extract and log metrics
         latency = time.time() - start_time
-        tracker.log_latency(total=latency)
+        _log_result_to_run(tracker, query, result, latency)
         
-        # Extract and log metrics
-        is_error = result.get('error') is not None
-        
-        if not is_error:
-            # LLM metrics
-            llm_metrics = extract_llm_metrics(result)
-            tracker.log_llm_metrics(
-                input_tokens=llm_metrics.input_tokens,
-                output_tokens=llm_metrics.output_tokens,
-                cost=llm_metrics.cost_usd,
-                model_id=llm_metrics.model_id
-            )
-            
-            # Context metrics
-            ctx_metrics = extract_context_metrics(result)
-            tracker.log_context_metrics(
-                context_length=ctx_metrics.context_length,
-                answer_length=ctx_metrics.answer_length
-            )
-            
-            # Retrieval metrics (from result if available)
-            ret_meta = result.get('metadata', {}).get('retrieval', {})
-            if ret_meta:
-                tracker.log_retrieval_metrics(
-                    kpi_count=ret_meta.get('kpi_count', 0),
-                    rag_count=ret_meta.get('rag_count', 0),
-                    tickers=ret_meta.get('tickers', []),
-                    years=ret_meta.get('years', []),
-                    sections=ret_meta.get('sections', [])
-                )
+        run_url = tracker.get_run_url()
+    
+    return result, run_url
+
+
+def run_many_with_mlflow_tracking(
+    queries: List[str],
+    model_root: Path,
+    model_key: Optional[str] = None,
+    include_kpi: bool = True,
+    include_rag: bool = True,
+    export_context: bool = False,
+    export_response: bool = False,
+    experiment_name: str = "FinRAG-Integration",
+    environment: str = "development",
+    tags: Optional[Dict[str, str]] = None
+) -> Tuple[List[Dict[str, Any]], List[str], Dict[str, Any]]:
+    """
+    Run a sweep of queries, one MLflow run per query.
+    
+    Tracker and model config are resolved once for the whole sweep. Per-query
+    values are written by index into NumPy columns (struct-of-arrays) instead
+    of per-run dataclasses. Every metric is logged inside its own run, so an
+    exception mid-sweep loses nothing already recorded.
+    
+    Args:
+        queries: Questions to run
+        (remaining args as in run_with_mlflow_tracking)
+    
+    Returns:
+        (results, run_ids, columns) - columns maps metric name -> np.ndarray
+        aligned with queries
+    """
+    import numpy as np
+    from finrag_ml_tg1.rag_modules_src.synthesis_pipeline.orchestrator import answer_query
+    
+    model_config = _load_model_config(model_root, model_key)
+    resolved_model_key = model_config.get('_resolved_key', model_key or 'default')
+    
+    tracker = _get_tracker(
+        experiment_name=experiment_name,
+        model_root=model_root,
+        environment=environment
+    )
+    
+    n = len(queries)
+    columns = {
+        'success': np.zeros(n, dtype=bool),
+        'input_tokens': np.zeros(n, dtype=np.int32),
+        'output_tokens': np.zeros(n, dtype=np.int32),
+        'cost_usd': np.zeros(n, dtype=np.float64),
+        'latency_seconds': np.zeros(n, dtype=np.float32),
+        'context_length_chars': np.zeros(n, dtype=np.int32),
+        'answer_length_chars': np.zeros(n, dtype=np.int32),
+    }
+    results: List[Dict[str, Any]] = []
+    run_ids: List[str] = []
+    
+    for i, query in enumerate(queries):
+        with tracker.start_run(
+            query=query,
+            model_key=resolved_model_key,
+            model_config=model_config,
+            prompt_versions={"system": "v1", "query": "v1"},
+            include_kpi=include_kpi,
+            include_rag=include_rag,
+            tags=tags
+        ) as run_id:
             
-            # Log artifacts
-            tracker.log_artifacts(
+            start_time = time.time()
+            result = answer_query(
                 query=query,
-                full_response=result
+                model_root=model_root,
+                include_kpi=include_kpi,
+                include_rag=include_rag,
+                model_key=model_key,
+                export_context=export_context,
+                export_response=export_response
             )
+            latency = time.time() - start_time
+            columns['latency_seconds'][i] = latency
+            
+            flat = _log_result_to_run(tracker, query, result, latency)
+            if flat is not None:
+                # Metadata may hold explicit None; NumPy int columns reject it
+                columns['success'][i] = True
+                columns['input_tokens'][i] = flat['llm.input_tokens'] or 0
+                columns['output_tokens'][i] = flat['llm.output_tokens'] or 0
+                columns['cost_usd'][i] = flat['llm.cost_usd'] or 0.0
+                columns['context_length_chars'][i] = flat['context.context_length'] or 0
+                columns['answer_length_chars'][i] = flat['context.answer_length'] or 0
         
-        run_url = tracker.get_run_url()
+        results.append(result)
+        run_ids.append(run_id)
     
-    return result, run_url
+    logger.info(
+        f"Sweep complete: {int(columns['success'].sum())}/{n} succeeded, "
+        f"total cost ${float(columns['cost_usd'].sum()):.4f}"
+    )
+    
+    return results, run_ids, columns
 
 
 def _load_model_config(model_root: Path, model_key: Optional[str]) -> Dict[str, Any]:
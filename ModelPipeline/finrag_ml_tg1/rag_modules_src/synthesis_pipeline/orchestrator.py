@@ -25,7 +25,7 @@ Does NOT:
 """
 
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 import logging
 import time
 
@@ -54,7 +54,8 @@ def answer_query(
     include_rag: bool = True,
     model_key: Optional[str] = None,
     export_context: bool = True,
-    export_response: bool = True
+    export_response: bool = True,
+    on_delta: Optional[Callable[[str], None]] = None
 ) -> Dict:
     """
     End-to-end query answering using FinRAG pipeline.
@@ -78,6 +79,9 @@ def answer_query(
                   Uses default from ml_config.yaml if None
         export_context: Whether to save assembled context to text file
         export_response: Whether to save full response to JSON file
+        on_delta: Optional callback for streaming. When set, the LLM call
+                  streams and each cleaned line of the answer is passed to it
+                  as soon as it is complete; the returned dict is unchanged.
     
     Returns:
         Dictionary (from QueryResponse.to_dict() or ErrorResponse.to_dict()):
@@ -255,10 +259,17 @@ def answer_query(
     # ========================================================================
     
     try:
-        llm_response = llm_client.invoke(
-            system=system_prompt,
-            user=user_prompt
-        )
+        if on_delta is None:
+            llm_response = llm_client.invoke(
+                system=system_prompt,
+                user=user_prompt
+            )
+        else:
+            llm_response = llm_client.invoke_stream(
+                system=system_prompt,
+                user=user_prompt,
+                on_text=on_delta
+            )
         
         logger.info(
             f"LLM response received: {llm_response['usage']['output_tokens']} tokens, "
@@ -19,10 +19,15 @@ ContextAssembler.__init__() will accept data_loader parameter
 """
 # ModelPipeline/finrag_ml_tg1/synthesis_pipeline/supply_lines.py
 
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from finrag_ml_tg1.rag_modules_src.entity_adapter.entity_adapter import EntityAdapter
 from finrag_ml_tg1.rag_modules_src.metric_pipeline.src.pipeline import MetricPipeline
@@ -45,6 +50,38 @@ from finrag_ml_tg1.rag_modules_src.rag_pipeline.context_assembler import (
 
 from finrag_ml_tg1.loaders.ml_config_loader import MLConfig
 
+# Shared across requests so the two supply lines can overlap without paying
+# thread start-up each turn. Both lines are I/O bound (parquet/pandas vs.
+# Bedrock + S3 Vectors HTTP), so threads are enough - the GIL is released.
+_SUPPLY_LINE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="supply_line")
+
+# Separate pool for the embed call inside supply line 2 - submitting to the
+# supply-line pool from one of its own workers could queue behind line 1.
+_EMBED_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="embed_query")
+
+# Bound on cached query embeddings per RAGComponents bundle (1024-d each).
+_EMBED_CACHE_MAX = 512
+
+logger = logging.getLogger(__name__)
+
+_RULE = "═" * 70
+
+# Header lines for the narrative block (built once, not per call)
+_RAG_HEADER: Tuple[str, ...] = (
+    _RULE,
+    "NARRATIVE CONTEXT - SEC FILINGS",
+    _RULE,
+)
+
+# Footer before the user question: blank separator, ruled title, blank line
+_USER_FOOTER_PREFIX: Tuple[str, ...] = (
+    "",
+    _RULE,
+    "USER QUESTION",
+    _RULE,
+    "",
+)
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Bundle of RAG components so callers don’t have to pass 7 args ertime orz.
 # ──────────────────────────────────────────────────────────────────────────────
@@ -59,17 +96,75 @@ class RAGComponents:
     retriever: S3VectorsRetriever
     expander: SentenceExpander
     assembler: ContextAssembler
-
-
-def init_rag_components() -> RAGComponents:
+    # Query-embedding LRU: (query, tickers, years) -> immutable vector
+    _embed_cache: "OrderedDict[Tuple, Tuple[float, ...]]" = field(
+        default_factory=OrderedDict, init=False, repr=False)
+    _embed_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _embed_hits: int = field(default=0, init=False, repr=False)
+    _embed_misses: int = field(default=0, init=False, repr=False)
+
+    def embed_query_cached(self, query: str, entities: Any) -> List[float]:
+        """
+        Memoized embedder.embed_query - identical queries (Streamlit reruns,
+        retries, A/B compares) skip the Bedrock round-trip.
+
+        The cached vector is stored as a tuple so no caller can mutate it;
+        each call hands back a fresh list because the S3 Vectors request
+        serializer expects plain floats.
+        """
+        key = (query, tuple(sorted(entities.companies.tickers)), tuple(entities.years.years))
+
+        with self._embed_lock:
+            vec = self._embed_cache.get(key)
+            if vec is not None:
+                self._embed_cache.move_to_end(key)
+                self._embed_hits += 1
+
+        if vec is None:
+            vec = tuple(self.embedder.embed_query(query, entities))
+            with self._embed_lock:
+                self._embed_misses += 1
+                self._embed_cache[key] = vec
+                if len(self._embed_cache) > _EMBED_CACHE_MAX:
+                    self._embed_cache.popitem(last=False)
+
+        logger.debug(
+            f"[RAGComponents] embed cache hits={self._embed_hits} "
+            f"misses={self._embed_misses} size={len(self._embed_cache)}"
+        )
+        return list(vec)
+
+
+# Process-wide bundle: parquet dims, KPI facts and boto clients stay resident
+# across requests (warm Lambda containers, Streamlit reruns, orchestrator calls).
+_RAG_SINGLETON: Optional[RAGComponents] = None
+_RAG_SINGLETON_LOCK = threading.Lock()
+
+
+def init_rag_components(force: bool = False) -> RAGComponents:
     """
     Convenience factory to build all core RAG components from the standard config.
     Centralizes initialization with Lambda-compatible DataLoader injection.
-    
+
+    Built once per process and reused; pass force=True to rebuild
+    (e.g. after config or credential changes).
     
     Returns:
         RAGComponents: Dataclass bundle of all initialized components
     """
+    global _RAG_SINGLETON
+
+    if _RAG_SINGLETON is not None and not force:
+        return _RAG_SINGLETON
+
+    with _RAG_SINGLETON_LOCK:
+        if _RAG_SINGLETON is None or force:
+            _RAG_SINGLETON = _build_rag_components()
+        return _RAG_SINGLETON
+
+
+def _build_rag_components() -> RAGComponents:
+    """Uncached construction behind init_rag_components()."""
     # ════════════════════════════════════════════════════════════════════
     # Initialize Config & DataLoader (NEW - Lambda-compatible)
     # ════════════════════════════════════════════════════════════════════
@@ -128,6 +223,11 @@ def init_rag_components() -> RAGComponents:
         assembler=assembler,
     )
 
+def _as_seq(items: Any) -> Tuple[Any, ...]:
+    """Read-only view for the formatter: reuse list/tuple, tuple() anything else."""
+    return items if isinstance(items, (list, tuple)) else tuple(items)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Supply Line 1: KPI side
 # ──────────────────────────────────────────────────────────────────────────────
@@ -135,27 +235,31 @@ def init_rag_components() -> RAGComponents:
 def run_supply_line_1_kpi(
     query: str,
     rag: RAGComponents,
+    entities: Any,
 ) -> Tuple[str, Any, Dict[str, Any]]:
     """
     Supply Line 1 wiring.
 
-    Query → EntityAdapter → MetricPipeline → KPI formatted block.
+    (entities) → MetricPipeline → KPI formatted block.
+
+    `entities` is the turn's EntityExtractionResult - extracted once by the
+    conductor (build_combined_context) and shared with supply line 2.
 
     Returns:
         kpi_block:    formatted KPI string (may be empty if no data)
-        entities:     EntityExtractionResult from EntityAdapter
+        entities:     the EntityExtractionResult passed in
         metric_result: raw dict from MetricPipeline.process()
     """
-    # 1) Extract entities once (even though MetricPipeline has its own logic)
-    entities = rag.adapter.extract(query)
+    # 1) Entities come from the conductor (MetricPipeline has its own logic)
 
     # 2) Run metric pipeline
     metric_result = rag.metric_pipeline.process(query)
 
     # 3) Build a small entity_meta summary for the formatter
+    #    (formatter only reads these, so existing sequences are passed as-is)
     entity_meta = {
-        "companies": list(entities.companies.tickers), "years": list(entities.years.years), 
-        "sections": list(entities.sections), }
+        "companies": _as_seq(entities.companies.tickers), "years": _as_seq(entities.years.years), 
+        "sections": _as_seq(entities.sections), }
 
     kpi_block = format_analytical_compact(metric_result, entity_meta=entity_meta)
 
@@ -171,12 +275,12 @@ def run_supply_line_1_kpi(
 def run_supply_line_2_rag(
     query: str,
     rag: RAGComponents,
+    entities: Any,
 ) -> Tuple[str, Any, Any, List[Any], str]:
     """
-    Supply Line 2 wiring.
+    Supply Line 2 wiring. `entities` is the shared per-turn extraction.
 
-    Query
-      → EntityAdapter
+    Query (+ entities)
       → QueryEmbedderV2
       → MetadataFilterBuilder
       → VariantPipeline (inside retriever)
@@ -198,21 +302,22 @@ def run_supply_line_2_rag(
 
     Returns:
         context_block:  full assembled context string with metadata header
-        entities:       EntityExtractionResult
+        entities:       the EntityExtractionResult passed in
         bundle:         RetrievalBundle from S3VectorsRetriever
         unique_sents:   list of expanded unique sentence records
         context_str:    raw context text (without the header wrapper)
     """
-    # Step 1: Entity extraction
-    entities = rag.adapter.extract(query)
+    # Step 1: Entity extraction - done once upstream by the conductor
 
-    # Step 2: Query embedding
-    base_embedding = rag.embedder.embed_query(query, entities)
+    # Step 2: Query embedding (Bedrock HTTP) - in flight while filters build
+    embed_future = _EMBED_EXECUTOR.submit(rag.embed_query_cached, query, entities)
 
-    # Step 3: Metadata filters
+    # Step 3: Metadata filters (CPU, independent of the embedding)
     filtered_filters = rag.filter_builder.build_filters(entities)
     global_filters = rag.filter_builder.build_global_filters(entities)
 
+    base_embedding = embed_future.result()
+
     # Steps 4–5: S3 retrieval (with variants internal to retriever)
     bundle = rag.retriever.retrieve(
         base_embedding=base_embedding,
@@ -227,15 +332,9 @@ def run_supply_line_2_rag(
     # Step 10: Context assembly
     context_str = rag.assembler.assemble(unique_sents)
 
-    # Very lean header: just tell the LLM what this block is
-    header_lines = [
-        "══════════════════════════════════════════════════════════════════════",
-        "NARRATIVE CONTEXT - SEC FILINGS",
-        "══════════════════════════════════════════════════════════════════════",
-        "",
-    ]
-
-    context_block = "\n".join(header_lines) + context_str + "\n"
+    # Very lean header: just tell the LLM what this block is.
+    # One join builds header + context + trailing newline in a single copy.
+    context_block = "\n".join((*_RAG_HEADER, context_str, ""))
 
     return context_block, entities, bundle, unique_sents, context_str
 
@@ -254,6 +353,7 @@ def build_combined_context(
 ) -> Tuple[str, Dict[str, Any]]:
     """
     High-level helper: run both supply lines and append their outputs.
+    The two lines run concurrently on a shared 2-worker thread pool.
     
     Final format:
         [KPI SNAPSHOT]
@@ -270,6 +370,58 @@ def build_combined_context(
         combined: big string (KPI + RAG + Query at end)
         meta:     minimal dict with intermediate pieces
     """
+    # Extract entities once per turn (explicit DAG root) and hand the same
+    # result to both lines.
+    entities = rag.adapter.extract(query) if (include_kpi or include_rag) else None
+
+    # Fire both supply lines at once; they share no mutable state.
+    kpi_future = _SUPPLY_LINE_EXECUTOR.submit(run_supply_line_1_kpi, query, rag, entities) if include_kpi else None
+    rag_future = _SUPPLY_LINE_EXECUTOR.submit(run_supply_line_2_rag, query, rag, entities) if include_rag else None
+
+    return _assemble_combined(
+        query,
+        kpi_future.result() if kpi_future is not None else None,
+        rag_future.result() if rag_future is not None else None,
+    )
+
+
+async def build_combined_context_async(
+    query: str,
+    rag: RAGComponents,
+    include_kpi: bool = True,
+    include_rag: bool = True,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Awaitable build_combined_context for asyncio callers (FastAPI handlers).
+
+    Entity extraction and both supply lines run on the shared supply-line
+    pool, so the event loop is never blocked by parquet work or the
+    Bedrock / S3 Vectors round-trips. Same output as the sync version.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def _skip() -> None:
+        return None
+
+    entities = None
+    if include_kpi or include_rag:
+        entities = await loop.run_in_executor(_SUPPLY_LINE_EXECUTOR, rag.adapter.extract, query)
+
+    kpi_out, rag_out = await asyncio.gather(
+        loop.run_in_executor(_SUPPLY_LINE_EXECUTOR, run_supply_line_1_kpi, query, rag, entities)
+        if include_kpi else _skip(),
+        loop.run_in_executor(_SUPPLY_LINE_EXECUTOR, run_supply_line_2_rag, query, rag, entities)
+        if include_rag else _skip(),
+    )
+    return _assemble_combined(query, kpi_out, rag_out)
+
+
+def _assemble_combined(
+    query: str,
+    kpi_out: Optional[Tuple[str, Any, Dict[str, Any]]],
+    rag_out: Optional[Tuple[str, Any, Any, List[Any], str]],
+) -> Tuple[str, Dict[str, Any]]:
+    """Join supply-line outputs (None = line skipped) into (combined, meta)."""
     meta: Dict[str, Any] = {
         "kpi_block": "",
         "rag_block": "",
@@ -282,8 +434,8 @@ def build_combined_context(
     pieces: List[str] = []
 
     # KPI side
-    if include_kpi:
-        kpi_block, kpi_entities, metric_result = run_supply_line_1_kpi(query, rag) # Updated by SR
+    if kpi_out is not None:
+        kpi_block, kpi_entities, metric_result = kpi_out # Updated by SR
         meta["kpi_block"] = kpi_block
         meta["kpi_entities"] = kpi_entities
         meta["metric_result"] = metric_result # Updated by SR
@@ -291,8 +443,8 @@ def build_combined_context(
             pieces.append(kpi_block)
 
     # RAG side
-    if include_rag:
-        rag_block, rag_entities, rag_bundle, _, _ = run_supply_line_2_rag(query, rag)
+    if rag_out is not None:
+        rag_block, rag_entities, rag_bundle, _, _ = rag_out
         meta["rag_block"] = rag_block
         meta["rag_entities"] = rag_entities
         meta["retrieval_bundle"] = rag_bundle
@@ -305,14 +457,8 @@ def build_combined_context(
     # Add query footer at the end
     # ------------------------------------------------------------------
     if pieces:  # Only add footer if we have content
-        pieces.append("")  # blank line before footer
-        pieces.extend([
-            "══════════════════════════════════════════════════════════════════════",
-            "USER QUESTION",
-            "══════════════════════════════════════════════════════════════════════",
-            "",
-            query
-        ])
+        pieces.extend(_USER_FOOTER_PREFIX)  # blank line + footer header
+        pieces.append(query)
 
     combined = "\n".join(pieces)
     return combined, meta
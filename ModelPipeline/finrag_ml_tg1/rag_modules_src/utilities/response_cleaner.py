@@ -6,9 +6,61 @@ Philosophy: Line-aware cleaning - preserve structure, neutralize triggers.
 
 import re
 import logging
+from functools import lru_cache
+from typing import List, Tuple
+
+# Optional: google-re2 gives a linear-time DFA for the wrapper alternation
+# (no backtracking on long unbalanced lines). Falls back to stdlib re.
+try:
+    import re2 as _wrapper_re
+except ImportError:
+    _wrapper_re = re
 
 logger = logging.getLogger(__name__)
 
+# ================================================================
+# Precompiled patterns (skip re's internal cache lookup per call)
+# ================================================================
+_RE_HEADING = re.compile(r'^(\s*)(#{1,6})\s*(.*)$')
+_RE_BULLET = re.compile(r'^(\s*)([-*+]|\d+\.)\s+(.*)$')
+
+# All wrappers in one alternation: $..$ | **..** | __..__ | *..* | _.._ | ~~..~~
+# Order matters - LaTeX first, doubled markers before single ones.
+# Only this pattern goes through re2: the escape patterns need lookbehind,
+# which re2 does not support.
+# Bodies are batch-cleaned joined by _SEP, so no wrapper may span it.
+_RE_WRAPPERS = _wrapper_re.compile(
+    r'\$([^\$\x1e]+)\$'
+    r'|\*\*([^\x1e]+?)\*\*'
+    r'|__([^\x1e]+?)__'
+    r'|\*([^\x1e]+?)\*'
+    r'|_([^\x1e]+?)_'
+    r'|~~([^\x1e]+?)~~'
+)
+
+_RE_ESC_STAR = re.compile(r'(?<!\\)\*')
+_RE_ESC_UNDER = re.compile(r'(?<!\\)_')
+
+# Any character that a wrapper or escape could touch
+_RE_TRIGGERS = re.compile(r'[$*_~]')
+
+# ASCII record separator: joins line bodies for one-shot batch cleaning
+_SEP = '\x1e'
+
+# Line kinds from ResponseCleaner._split_line
+_LINE_BLANK = 'blank'
+_LINE_HEADING = 'heading'
+_LINE_BULLET = 'bullet'
+_LINE_ORDINARY = 'ordinary'
+
+# C-level single pass for the common case (no pre-existing backslashes)
+_ESCAPE_TABLE = str.maketrans({'$': 'USD ', '*': '\\*', '_': '\\_'})
+
+
+def _unwrap(m) -> str:
+    """Return the inner content of whichever wrapper alternative matched."""
+    return next(g for g in m.groups() if g is not None)
+
 
 class ResponseCleaner:
     """
@@ -28,12 +80,17 @@ class ResponseCleaner:
     """
     
     def __init__(self, log_changes: bool = False):
+        # Only config lives on the instance; clean() keeps no per-call state,
+        # so one cleaner can be shared across threads.
         self.log_changes = log_changes
-        self._changes_made = []
     
     def clean(self, text: str) -> str:
         """
         Clean LLM response line-by-line.
+
+        Lines are classified individually, but every body that needs work
+        is joined with a record separator and stripped/escaped in one shot,
+        so the regex passes run once per response instead of once per line.
         
         Args:
             text: Raw LLM output
@@ -44,21 +101,30 @@ class ResponseCleaner:
         if not text:
             return text
         
-        self._changes_made = []
-        
-        # Process line-by-line
-        cleaned_lines = []
-        for line in text.split('\n'):
-            cleaned_line = self._clean_line(line)
-            cleaned_lines.append(cleaned_line)
-        
-        result = '\n'.join(cleaned_lines)
+        parts = [self._split_line(line) for line in text.split('\n')]
+
+        # Bodies that actually carry a trigger character
+        todo = [i for i, (kind, _, _, body) in enumerate(parts)
+                if kind is not _LINE_BLANK and _RE_TRIGGERS.search(body)]
+
+        cleaned = {}
+        if todo:
+            if _SEP in text:
+                # Sentinel collides with input - fall back to per-body cleaning
+                cleaned = {i: self._clean_body(parts[i][3]) for i in todo}
+            else:
+                joined = _SEP.join(parts[i][3] for i in todo)
+                batch = self._escape_triggers(self._strip_wrappers(joined))
+                cleaned = dict(zip(todo, batch.split(_SEP)))
+
+        rebuild = self._rebuild_line
+        result = '\n'.join(
+            rebuild(kind, indent, marker, cleaned.get(i, body))
+            for i, (kind, indent, marker, body) in enumerate(parts)
+        )
         
         if self.log_changes:
-            logger.info(
-                f"ResponseCleaner: {len(self._changes_made)} operations, "
-                f"{len(text)} → {len(result)} chars"
-            )
+            logger.info(f"ResponseCleaner: {len(text)} → {len(result)} chars")
         
         return result
     
@@ -71,49 +137,66 @@ class ResponseCleaner:
             2. Bullet/List (starts with -, *, +, 1.) → Preserve prefix, clean body
             3. Ordinary → Full cleaning
         """
+        kind, indent, marker, body = self._split_line(line)
+        if kind is _LINE_BLANK:
+            return line
+        return self._rebuild_line(kind, indent, marker, self._clean_body(body))
+
+    def _split_line(self, line: str) -> Tuple[str, str, str, str]:
+        """
+        Classify a line → (kind, indent, marker, body). Only `body` is cleaned.
+        """
+        # First non-space char decides which (if any) structural regex can
+        # match - no lstrip() copy, and most lines skip both regexes.
+        i, n = 0, len(line)
+        while i < n and line[i].isspace():
+            i += 1
+        if i == n:
+            return _LINE_BLANK, '', '', line  # blank / whitespace-only
+        c = line[i]
+
         # ================================================================
         # Type 1: Heading - PRESERVE STRUCTURE, CLEAN BODY
         # ================================================================
         # Pattern: optional indent + 1-6 hashes + optional space + body
         # Example: "  ## Revenue Analysis *2022*" → "  ## Revenue Analysis 2022"
         
-        heading_match = re.match(r'^(\s*)(#{1,6})\s*(.*)$', line)
+        heading_match = _RE_HEADING.match(line) if c == '#' else None
         if heading_match:
-            indent = heading_match.group(1)
-            hashes = heading_match.group(2)
-            body = heading_match.group(3)
-            
-            # Clean the heading body (remove wrappers, escape triggers)
-            body = self._strip_wrappers(body)
-            body = self._escape_triggers(body)
-            
-            # Reconstruct: indent + hashes + space + body
-            cleaned = f"{hashes} {body}".rstrip() if body else hashes
-            return f"{indent}{cleaned}"
+            return (_LINE_HEADING,) + heading_match.groups()
         
         # ================================================================
         # Type 2: Bullet/List - PRESERVE PREFIX, CLEAN BODY
         # ================================================================
         # Patterns: "- item", "  * item", "1. item", "  + item"
-        bullet_match = re.match(r'^(\s*)([-*+]|\d+\.)\s+(.*)$', line)
+        bullet_match = _RE_BULLET.match(line) if (c in '-*+' or c.isdigit()) else None
         if bullet_match:
-            indent = bullet_match.group(1)
-            prefix = bullet_match.group(2)
-            body = bullet_match.group(3)
-            
-            # Clean the body part only
-            body = self._strip_wrappers(body)
-            body = self._escape_triggers(body)
-            
-            return f"{indent}{prefix} {body}"
+            return (_LINE_BULLET,) + bullet_match.groups()
         
         # ================================================================
         # Type 3: Ordinary Line - FULL CLEANING
         # ================================================================
-        line = self._strip_wrappers(line)
-        line = self._escape_triggers(line)
-        
-        return line
+        return _LINE_ORDINARY, '', '', line
+
+    @staticmethod
+    def _rebuild_line(kind: str, indent: str, marker: str, body: str) -> str:
+        """Reassemble a classified line around its (cleaned) body."""
+        if kind is _LINE_HEADING:
+            # Reconstruct: indent + hashes + space + body
+            cleaned = f"{marker} {body}".rstrip() if body else marker
+            return f"{indent}{cleaned}"
+        if kind is _LINE_BULLET:
+            return f"{indent}{marker} {body}"
+        return body
+    
+    def _clean_body(self, text: str) -> str:
+        """
+        Strip wrappers then escape triggers. Most lines carry no trigger
+        character at all, so one C-level scan lets them skip both steps.
+        """
+        if _RE_TRIGGERS.search(text) is None:
+            return text
+        return self._escape_triggers(self._strip_wrappers(text))
     
     def _strip_wrappers(self, text: str) -> str:
         """
@@ -125,22 +208,13 @@ class ResponseCleaner:
             *italic*, _italic_
             ~~strikethrough~~
         
-        Simple unwrapping - no fancy logic.
+        Simple unwrapping - no fancy logic. One fused pass per round;
+        repeats only while something was unwrapped (nested wrappers like
+        **$10B$** need a second round).
         """
-        # LaTeX: $content$ → content
-        text = re.sub(r'\$([^\$]+)\$', r'\1', text)
-        
-        # Bold: **text** and __text__
-        text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-        text = re.sub(r'__(.+?)__', r'\1', text)
-        
-        # Italic: *text* and _text_
-        text = re.sub(r'\*(.+?)\*', r'\1', text)
-        text = re.sub(r'_(.+?)_', r'\1', text)
-        
-        # Strikethrough: ~~text~~
-        text = re.sub(r'~~(.+?)~~', r'\1', text)
-        
+        text, n = _RE_WRAPPERS.subn(_unwrap, text)
+        while n:
+            text, n = _RE_WRAPPERS.subn(_unwrap, text)
         return text
     
     
@@ -154,21 +228,44 @@ class ResponseCleaner:
         
         Hard guarantee: No LaTeX math mode possible after this.
         """
+        # No backslash → nothing is pre-escaped, one translate does it all
+        if '\\' not in text:
+            return text.translate(_ESCAPE_TABLE)
+
         # Replace all $ with USD (no dollar symbol remains)
         text = text.replace('$', 'USD ')
         
         # Escape asterisks and underscores (idempotent)
-        text = re.sub(r'(?<!\\)\*', '\\*', text)
-        text = re.sub(r'(?<!\\)_', '\\_', text)
+        text = _RE_ESC_STAR.sub('\\*', text)
+        text = _RE_ESC_UNDER.sub('\\_', text)
         
         return text
 
 
 
+# Stateless after construction → one shared instance per log mode
+_SHARED_CLEANER = ResponseCleaner(log_changes=False)
+_SHARED_LOGGING_CLEANER = ResponseCleaner(log_changes=True)
+
+
 def clean_llm_response(text: str, log_changes: bool = False) -> str:
-    """Convenience function."""
-    cleaner = ResponseCleaner(log_changes=log_changes)
-    return cleaner.clean(text)
+    """Convenience function. Memoized when log_changes is False."""
+    if not log_changes:
+        return _clean_cached(text)
+    return _SHARED_LOGGING_CLEANER.clean(text)
+
+
+@lru_cache(maxsize=256)
+def _clean_cached(text: str) -> str:
+    return _SHARED_CLEANER.clean(text)
+
+
+def clean_llm_responses(texts: List[str]) -> List[str]:
+    """
+    Batch form for chat-history rerenders: every past assistant turn is
+    re-cleaned on each Streamlit rerun, so unchanged turns hit the cache.
+    """
+    return [_clean_cached(text) for text in texts]
 
 
 # Testing
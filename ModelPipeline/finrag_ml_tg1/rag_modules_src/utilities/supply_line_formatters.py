@@ -114,6 +114,8 @@ def format_analytical_compact(
                 "sections": ["ITEM_7", "ITEM_1A"],
               }
             If provided, these are shown as "(entities)" lines in the header.
+            Values may be any sized sequence (list or tuple); they are only
+            read, never copied or mutated.
 
     Returns:
         Multi-line string containing:
@@ -8,7 +8,9 @@ Architecture:
     
 Endpoints:
     POST /query - Main query endpoint
+    POST /query_batch - Several questions in one round-trip
     GET /health - Health check
+    GET|HEAD /healthz - Liveness probe (204, no body)
     GET /docs - Auto-generated API documentation
 
 Usage:
@@ -18,8 +20,10 @@ Usage:
  FastAPI Application (api_service.py)
    ├── GET  /          → Service info
    ├── GET  /health    → Health check
+   ├── HEAD /healthz   → Liveness probe (204, no body)
    ├── GET  /docs      → Auto-generated API docs
    ├── POST /query     → Main query endpoint
+   ├── POST /query_batch → Several questions, one round-trip
    └── Uvicorn server running on port 8000
 
  Configuration Management (config.py)
@@ -35,18 +39,23 @@ Usage:
 
 """
 
+import asyncio
+import json
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Optional
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from loguru import logger
 
 from backend.models import (
     QueryRequest,
+    QueryBatchRequest,
     QueryResponse,
     ErrorResponse,
     HealthResponse
@@ -160,6 +169,16 @@ async def health_check():
 
 
 
+@app.api_route("/healthz", methods=["GET", "HEAD"], status_code=204, tags=["Health"])
+async def liveness_probe():
+    """
+    Liveness probe - 204 with no body, nothing to serialize.
+    
+    Used by the frontend status check; /health keeps the detailed report.
+    """
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
 @app.post("/query", response_model=QueryResponse, tags=["Query"])
 async def query_endpoint(request: QueryRequest):
     """
@@ -250,6 +269,102 @@ async def query_endpoint(request: QueryRequest):
         )
 
 
+@app.post("/query_batch", tags=["Query"])
+async def query_batch_endpoint(request: QueryBatchRequest):
+    """
+    Batch query endpoint - several questions in one HTTP round-trip.
+    
+    Each question goes through the same orchestrator call as /query. One
+    failing question does not fail the batch: its slot holds an
+    ErrorResponse-shaped dict instead.
+    
+    Returns:
+        {"results": [QueryResponse | ErrorResponse dict, ...]} in input order
+        
+    Example:
+        POST /query_batch
+        {
+            "queries": ["What was Apple's revenue in 2023?", "..."],
+            "include_kpi": true,
+            "include_rag": true
+        }
+    """
+    logger.info(f"📥 Received batch of {len(request.queries)} queries")
+    
+    # Orchestrator calls block - run them off the event loop, in order
+    results = await run_in_threadpool(
+        lambda: [
+            _answer_one(question, request.include_kpi, request.include_rag, request.model_key)
+            for question in request.queries
+        ]
+    )
+    
+    return {"results": results}
+
+
+@app.post("/query/stream", tags=["Query"])
+async def query_stream_endpoint(request: QueryRequest):
+    """
+    Streaming variant of /query - answer text arrives line by line.
+    
+    Response body is NDJSON, one event per line:
+        {"type": "delta", "text": "..."}                 (zero or more)
+        {"type": "result", "result": {QueryResponse}}    (on success)
+        {"type": "error", "result": {ErrorResponse}}     (on failure)
+    
+    Exactly one "result" or "error" event closes the stream. Concatenating
+    the delta texts gives the same string as result["answer"].
+    """
+    logger.info(f"📥 Received streaming query: {request.question[:50]}...")
+    
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    
+    def push(event: Dict[str, Any]) -> None:
+        loop.call_soon_threadsafe(events.put_nowait, event)
+    
+    def run() -> None:
+        item = None
+        try:
+            item = _answer_one(
+                request.question,
+                request.include_kpi,
+                request.include_rag,
+                request.model_key,
+                on_delta=lambda text: push({"type": "delta", "text": text})
+            )
+        finally:
+            if item is None:
+                item = ErrorResponse(
+                    query=request.question,
+                    error="Streaming worker failed",
+                    error_type="UnknownError",
+                    stage="unexpected",
+                    timestamp=datetime.utcnow().isoformat() + "Z"
+                ).model_dump()
+            kind = "error" if item.get("error") else "result"
+            push({"type": kind, "result": item})
+    
+    # Orchestrator blocks - run it off the event loop; events wake the
+    # generator below directly, no polling
+    worker = asyncio.ensure_future(run_in_threadpool(run))
+    
+    async def event_stream():
+        while True:
+            event = await events.get()
+            yield json.dumps(jsonable_encoder(event)) + "\n"
+            if event["type"] != "delta":
+                break
+        # Closing event is already sent - a late worker failure can only
+        # be logged, not reported to the client
+        try:
+            await worker
+        except Exception as e:
+            logger.exception(f"💥 Streaming worker failed after closing event: {e}")
+    
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -276,6 +391,52 @@ def _get_status_code_for_error(stage: str) -> int:
     return error_map.get(stage, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+def _answer_one(
+    question: str,
+    include_kpi: bool,
+    include_rag: bool,
+    model_key: Optional[str],
+    on_delta: Optional[Callable[[str], None]] = None
+) -> Dict[str, Any]:
+    """
+    Run one question for /query_batch and /query/stream.
+    
+    Returns:
+        QueryResponse dict on success, ErrorResponse dict on failure
+    """
+    try:
+        result = answer_query(
+            query=question,
+            model_root=MODEL_PIPELINE_ROOT,
+            include_kpi=include_kpi,
+            include_rag=include_rag,
+            model_key=model_key,
+            export_context=config.enable_exports,
+            export_response=config.enable_exports,
+            on_delta=on_delta
+        )
+        if not result.get("error"):
+            # Same filtering as /query's response_model (drops internal
+            # "exports"); a result that fails validation becomes this
+            # item's ErrorResponse below
+            return QueryResponse.model_validate(result).model_dump()
+    except Exception as e:
+        logger.exception(f"💥 Unexpected error processing batch query: {e}")
+        result = {"error": str(e), "error_type": type(e).__name__, "stage": "unexpected"}
+    
+    logger.error(
+        f"❌ Orchestrator error: {result['error']} "
+        f"(stage: {result.get('stage', 'unknown')})"
+    )
+    return ErrorResponse(
+        query=question,
+        error=result["error"],
+        error_type=result.get("error_type", "UnknownError"),
+        stage=result.get("stage", "unknown"),
+        timestamp=result.get("timestamp", datetime.utcnow().isoformat() + "Z")
+    ).model_dump()
+
+
 # ============================================================================
 # MAIN (for direct execution)
 # ============================================================================
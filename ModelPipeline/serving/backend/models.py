@@ -12,8 +12,8 @@ model_fields - introspect fields
 model_validate() - validate data
 """
 
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional, Dict, Any, List, Annotated
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints
 
 
 # ============================================================================
@@ -60,6 +60,34 @@ class QueryRequest(BaseModel):
     )
 
 
+class QueryBatchRequest(BaseModel):
+    """
+    Request model for /query_batch endpoint.
+    
+    Several questions in one HTTP round-trip (e.g. "Run all examples"),
+    sharing the same options. Same per-question limits as QueryRequest.
+    
+    Example:
+        {
+            "queries": ["What was Apple's revenue in 2023?", "..."],
+            "include_kpi": true,
+            "include_rag": true
+        }
+    """
+    model_config = ConfigDict(protected_namespaces=())
+    
+    queries: List[Annotated[str, StringConstraints(min_length=10, max_length=3500)]] = Field(
+        ...,
+        min_length=1,
+        max_length=10,
+        description="Natural language questions about 10-K filings (1-10)"
+    )
+    
+    include_kpi: bool = Field(default=True, description="Include structured KPI data (Supply Line 1)")
+    include_rag: bool = Field(default=True, description="Include semantic RAG context (Supply Line 2)")
+    model_key: Optional[str] = Field(default=None, description="Model selection, as in QueryRequest")
+
+
 # ============================================================================
 # RESPONSE MODELS
 # ============================================================================
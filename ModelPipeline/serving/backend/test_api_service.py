@@ -2,7 +2,7 @@
 Minimal test suite for FastAPI backend.
 
 Tests:
-1. Server health check
+1. Server health check (+ /healthz liveness probe)
 2. Root endpoint
 3. Query endpoint with valid request
 4. Query endpoint with invalid request
@@ -53,6 +53,30 @@ def test_health():
         return False
 
 
+def test_healthz():
+    """Test liveness probe: HEAD and GET both answer 204 with no body."""
+    console.print("\n[bold cyan]Test 1b: Liveness Probe (/healthz)[/bold cyan]")
+    
+    try:
+        ok = True
+        for method in ("HEAD", "GET"):
+            response = requests.request(method, f"{BASE_URL}/healthz", timeout=5)
+            
+            if response.status_code == 204 and not response.content:
+                console.print(f"✅ {method} /healthz: {response.status_code}")
+            else:
+                console.print(f"❌ {method} /healthz: expected 204, got {response.status_code}")
+                ok = False
+        return ok
+            
+    except requests.exceptions.ConnectionError:
+        console.print("❌ Cannot connect to server. Is it running?")
+        return False
+    except Exception as e:
+        console.print(f"❌ Error: {e}")
+        return False
+
+
 def test_root():
     """Test root endpoint."""
     console.print("\n[bold cyan]Test 2: Root Endpoint[/bold cyan]")
@@ -227,6 +251,7 @@ def run_all_tests():
     
     results = {
         "Health Check": test_health(),
+        "Liveness Probe": test_healthz(),
         "Root Endpoint": test_root(),
         "Valid Query": test_query_valid(),
         "Invalid Query": test_query_invalid()
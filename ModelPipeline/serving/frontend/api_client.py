@@ -13,15 +13,22 @@ OUTPUT: QueryResponse dict or ErrorResponse dict
 
 class FinSightClient:
     - __init__(base_url, timeout)
-    - health_check() → dict
+    - health_check(force=False, max_age=None) → dict  # 5s TTL cache by default
+    - health_check_background(force=False) → Future[dict]
     - query(question, ...) → dict
+    - query_stream(question, ...) → iter[str, ..., dict]  # POST /query/stream
+    - query_many(questions, ...) → list[dict]  # Concurrent, needs aiohttp
+    - query_batch(questions, ...) → list[dict]  # One POST /query_batch
+
+get_shared_client(base_url, timeout) → FinSightClient  # one per process
     - _handle_response(response) → dict  # Helper
 
 Backend URL: http://localhost:8000
 Timeout: 120s (queries take ~10-15s)
 Request format: {"question": str, "include_kpi": bool, "include_rag": bool, "model_key": Optional[str]}
 Success response has: query, answer, context, metadata
-Error response has: query, error, error_type, stage, timestamp
+Error response has: query, error, error_type, stage, timestamp_epoch (or backend's timestamp)
+                    → format with error_timestamp(resp) only when displayed
 
 Important updates on the flow:
 No BACKEND_URL env var set - finSightClient() called with no arguments, None, 
@@ -52,12 +59,114 @@ Usage:
 """
 
 import requests
-from typing import Dict, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+import asyncio
+import atexit
+import collections
+import json
 import os
+import threading
+import time
 from config import BACKEND_URL, API_TIMEOUT
 ## why os?: things are gonna get on cloud soon. we use os.environ. > patterns. 
 
+# Optional: concurrent batch queries (query_many). Falls back to serial calls.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: orjson parses response bytes directly (no bytes→str step) and
+# encodes payloads faster. Both fallbacks accept/return the same shapes;
+# orjson.JSONDecodeError subclasses ValueError like json's does.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Seconds to open the TCP connection. Kept separate from the read timeout so
+# a down backend is reported in seconds, not after the full query timeout.
+_CONNECT_TIMEOUT = 3.0
+
+# Ceiling for the adaptive /query read timeout. Successes are recorded up to
+# the current timeout, so without a cap 2*P99 would ratchet it up run by run.
+_MAX_TIMEOUT = 120.0
+
+# Transient gateway/availability statuses, retried by urllib3. Still seeing
+# one after the retries counts as a failure for the circuit breaker.
+_RETRY_STATUSES = (502, 503, 504)
+
+# Background work that should overlap a query (health pings). Small and
+# process-wide: the calls are I/O-bound and share the client's pool.
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="finsight-bg")
+
+
+@lru_cache(maxsize=64)
+def _serialize_payload(
+    question: str,
+    include_kpi: bool,
+    include_rag: bool,
+    model_key: Optional[str]
+) -> bytes:
+    """
+    Encoded /query request body.
+    
+    Pure function of its arguments, so memoized - re-clicking an example
+    question reuses the same bytes.
+    """
+    payload = {
+        "question": question,
+        "include_kpi": include_kpi,
+        "include_rag": include_rag,
+    }
+    
+    # Add model_key only if provided
+    if model_key is not None:
+        payload["model_key"] = model_key
+    
+    return _json_dumps(payload)
+
+
+def error_timestamp(response: Dict[str, Any]) -> Optional[str]:
+    """
+    ISO timestamp of an error response, formatted only when displayed.
+    
+    Backend-supplied "timestamp" strings are returned as-is; client-side
+    errors carry a cheap "timestamp_epoch" float instead.
+    """
+    if "timestamp" in response:
+        return response["timestamp"]
+    epoch = response.get("timestamp_epoch")
+    if epoch is None:
+        return None
+    return datetime.utcfromtimestamp(epoch).isoformat()
+
+
+class _BufferedResponse:
+    """
+    Minimal requests.Response stand-in for an already-read aiohttp body,
+    so the _handle_* helpers serve both transports unchanged.
+    """
+    
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+    
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+
 class FinSightClient:
     """
     Client for communicating with FinSight FastAPI backend.
@@ -72,7 +181,8 @@ class FinSightClient:
         ## base_url: str = "http://localhost:8000", 
         ## hardcoded default - changed now. use None.
         base_url: Optional[str] = None,
-        timeout: int = 120
+        timeout: int = 120,
+        pool_maxsize: int = 16
     ):
         """
         Initialize API client.
@@ -80,6 +190,7 @@ class FinSightClient:
         Args:
             base_url: Backend API URL
             timeout: Request timeout (queries can take 10-15s)
+            pool_maxsize: Keep-alive connections kept per host
         """
         
         # Environment-aware backend URL
@@ -93,14 +204,114 @@ class FinSightClient:
         
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        
+        # Endpoint URLs, built once
+        self._query_url = f"{self.base_url}/query"
+        self._batch_url = f"{self.base_url}/query_batch"
+        self._stream_url = f"{self.base_url}/query/stream"
+        self._health_url = f"{self.base_url}/health"
+        self._healthz_url = f"{self.base_url}/healthz"
+        
+        # (monotonic timestamp, result) of the last health check
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._health_ttl = 5.0
+        self._healthz_supported = True  # flips off on 404/405 from HEAD /healthz
+        
+        # Circuit breaker: after _cb_threshold consecutive transport failures
+        # (connect timeout / unreachable), fail fast for _cb_reset seconds
+        # instead of letting every question hang on a dead backend. Read
+        # timeouts don't count - the backend is up, just slow.
+        self._cb_failures = 0
+        self._cb_open_until = 0.0
+        self._cb_threshold = 3
+        self._cb_reset = 30.0
+        
+        # Status class (status_code // 100) → response handler
+        self._status_dispatch = {
+            2: self._handle_success_response,
+            4: self._handle_client_error,
+            5: self._handle_server_error,
+        }
+        
+        # Recent successful /query latencies (seconds) → adaptive timeout
+        self._latencies: collections.deque = collections.deque(maxlen=256)
+        
+        # Guards _latencies and the _cb_* counters - the shared client is
+        # used from every Streamlit session thread and the background executor
+        self._lock = threading.Lock()
+        
+        # One pooled keep-alive session for every call - no TCP/TLS handshake
+        # per query. get_shared_client() caches this client across reruns.
+        self.session = self._build_session(pool_maxsize)
     
     
-    def health_check(self) -> Dict[str, Any]:
+    @staticmethod
+    def _build_session(pool_maxsize: int = 16) -> requests.Session:
+        """
+        Create the pooled HTTP session.
+        
+        Transient failures are retried inside urllib3 with jittered
+        exponential backoff: connect errors, and 502/503/504 answers (also
+        for POST /query - the request was rejected, not half-processed).
+        Read errors are never retried: a read timeout on /query means the
+        backend may still be working, and replaying would double the cost.
+        """
+        retry = Retry(
+            total=3,
+            connect=2,
+            read=0,
+            status=2,
+            backoff_factor=0.25,
+            backoff_jitter=0.1,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset(["HEAD", "GET", "POST"]),
+            raise_on_status=False,
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry)
+        
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Connection": "keep-alive",
+            "Accept": "application/json"
+        })
+        return session
+    
+    
+    def close(self) -> None:
+        """Release pooled connections and cached request bodies."""
+        self.session.close()
+        _serialize_payload.cache_clear()
+    
+    def __enter__(self) -> "FinSightClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    
+    def health_check(
+        self,
+        force: bool = False,
+        max_age: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Check if backend is running and healthy.
         
+        Results are reused for a few seconds (_health_ttl) so rapid repeated
+        checks don't each cost a round-trip.
+        
+        Args:
+            force: Skip the cached result and always hit /health
+            max_age: Accept a cached result up to this many seconds old
+                     (default: _health_ttl)
+        
         Returns:
             dict: Health status response
+                {"status": "healthy"}  (HEAD /healthz probe)
+                or, from older backends via GET /health:
                 {
                     "status": "healthy",
                     "model_root_exists": bool,
@@ -111,13 +322,57 @@ class FinSightClient:
         Raises:
             Never raises - returns error dict on failure
         """
+        cached = self._health_cache
+        ttl = self._health_ttl if max_age is None else max_age
+        if not force and cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        result = self._fetch_health()
+        self._health_cache = (time.monotonic(), result)
+        return result
+    
+    
+    def health_check_background(self, force: bool = False) -> "Future[Dict[str, Any]]":
+        """
+        Run health_check() on a background thread.
+        
+        Lets a caller overlap the health ping with a query instead of paying
+        for it as a separate round-trip; call .result() once the query is done.
+        """
+        return _EXECUTOR.submit(self.health_check, force)
+    
+    
+    def _fetch_health(self) -> Dict[str, Any]:
+        """
+        HEAD /healthz (no body to build or parse), mapping every failure to
+        a status dict. Backends without /healthz get GET /health instead.
+        """
         try:
-            response = requests.get(
-                f"{self.base_url}/health",
+            if self._healthz_supported:
+                response = self.session.head(
+                    self._healthz_url,
+                    timeout=1.5,  # liveness only - fail fast
+                    allow_redirects=False
+                )
+                if response.status_code in (200, 204):
+                    return {"status": "healthy"}
+                if response.status_code not in (404, 405):
+                    return {
+                        "status": "error",
+                        "error": f"Health probe returned HTTP {response.status_code}"
+                    }
+                self._healthz_supported = False  # older backend - stop probing
+            
+            response = self.session.get(
+                self._health_url,
                 timeout=5  # Quick timeout for health check
             )
-            response.raise_for_status()
-            return response.json()
+            if not response.ok:
+                return {
+                    "status": "error",
+                    "error": f"Health check returned HTTP {response.status_code}"
+                }
+            return _json_loads(response.content)
         
         except requests.exceptions.Timeout:
             return {
@@ -177,41 +432,54 @@ class FinSightClient:
                 "error": str,
                 "error_type": str,
                 "stage": str,
-                "timestamp": str,
+                "timestamp_epoch": float,  (or backend's "timestamp": str)
                 "http_status": int (optional)
             }
         """
-        # Build request payload
-        payload = {
-            "question": question,
-            "include_kpi": include_kpi,
-            "include_rag": include_rag,
-        }
+        if not self._circuit_allows():
+            return self._circuit_open_response(question)
         
-        # Add model_key only if provided
-        if model_key is not None:
-            payload["model_key"] = model_key
+        body = _serialize_payload(question, include_kpi, include_rag, model_key)
+        timeout = self._compute_timeout()
         
         try:
             # Send POST request
-            response = requests.post(
-                f"{self.base_url}/query",
-                json=payload,
-                timeout=self.timeout
+            t0 = time.monotonic()
+            response = self.session.post(
+                self._query_url,
+                data=body,
+                headers=_JSON_HEADERS,
+                timeout=(_CONNECT_TIMEOUT, timeout)
             )
+            if response.status_code < 300:
+                self._record_latency(time.monotonic() - t0)
+            
+            self._record_outcome(response.status_code)
             
             # Handle response based on status code
             return self._handle_response(response, question)
         
+        except requests.exceptions.ConnectTimeout:
+            # Socket never opened - unreachable, not a slow query
+            self._record_failure()
+            return self._error_response(
+                query=question,
+                error=f"Cannot connect to backend at {self.base_url}",
+                error_type="ConnectionError",
+                stage="http_request"
+            )
+        
         except requests.exceptions.Timeout:
+            # Read timeout: backend accepted the request, it is slow, not down
             return self._error_response(
                 query=question,
-                error=f"Query timed out after {self.timeout} seconds",
+                error=f"Query timed out after {timeout:.0f} seconds",
                 error_type="TimeoutError",
                 stage="http_request"
             )
         
         except requests.exceptions.ConnectionError:
+            self._record_failure()
             return self._error_response(
                 query=question,
                 error=f"Cannot connect to backend at {self.base_url}",
@@ -228,10 +496,397 @@ class FinSightClient:
             )
     
     
+    def query_stream(
+        self,
+        question: str,
+        include_kpi: bool = True,
+        include_rag: bool = True,
+        model_key: Optional[str] = None
+    ) -> Iterator[Union[str, Dict[str, Any]]]:
+        """
+        Streaming variant of query() via POST /query/stream.
+        
+        Yields answer text chunks (str) as the backend produces them, then
+        exactly one final dict shaped like query()'s return value. Falls back
+        to a single query() call when the backend has no streaming route.
+        
+        Usage:
+            for item in client.query_stream(question):
+                if isinstance(item, str):
+                    ...  # render partial text
+                else:
+                    result = item
+        """
+        if not self._circuit_allows():
+            yield self._circuit_open_response(question)
+            return
+        
+        body = _serialize_payload(question, include_kpi, include_rag, model_key)
+        timeout = self._compute_timeout()
+        
+        try:
+            t0 = time.monotonic()
+            with self.session.post(
+                self._stream_url,
+                data=body,
+                headers=_JSON_HEADERS,
+                timeout=(_CONNECT_TIMEOUT, timeout),
+                stream=True
+            ) as response:
+                status_code = response.status_code
+                
+                if status_code in (404, 405):
+                    # Older backend without /query/stream
+                    response.close()
+                    yield self.query(question, include_kpi, include_rag, model_key)
+                    return
+                
+                if status_code >= 300:
+                    self._record_outcome(status_code)
+                    yield self._handle_response(response, question)
+                    return
+                
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    event = _json_loads(line)
+                    if event.get("type") == "delta":
+                        yield event["text"]
+                        continue
+                    
+                    self._record_latency(time.monotonic() - t0)
+                    self._record_success()
+                    yield self._package_result(event["result"], question)
+                    return
+            
+            # Connection closed before the closing event
+            self._record_failure()
+            yield self._error_response(
+                query=question,
+                error="Backend closed the stream before sending a result",
+                error_type="IncompleteStream",
+                stage="http_response"
+            )
+        
+        except requests.exceptions.ConnectTimeout:
+            self._record_failure()
+            yield self._error_response(
+                query=question,
+                error=f"Cannot connect to backend at {self.base_url}",
+                error_type="ConnectionError",
+                stage="http_request"
+            )
+        
+        except requests.exceptions.Timeout:
+            # Read timeout: backend accepted the request, it is slow, not down
+            yield self._error_response(
+                query=question,
+                error=f"Query timed out after {timeout:.0f} seconds",
+                error_type="TimeoutError",
+                stage="http_request"
+            )
+        
+        except requests.exceptions.ConnectionError:
+            self._record_failure()
+            yield self._error_response(
+                query=question,
+                error=f"Cannot connect to backend at {self.base_url}",
+                error_type="ConnectionError",
+                stage="http_request"
+            )
+        
+        except ValueError:
+            yield self._error_response(
+                query=question,
+                error="Backend returned invalid JSON",
+                error_type="InvalidJSON",
+                stage="response_parsing"
+            )
+        
+        except Exception as e:
+            yield self._error_response(
+                query=question,
+                error=f"Unexpected error: {str(e)}",
+                error_type="UnexpectedError",
+                stage="http_request"
+            )
+    
+    
+    def query_many(
+        self,
+        questions: List[str],
+        include_kpi: bool = True,
+        include_rag: bool = True,
+        model_key: Optional[str] = None,
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several queries concurrently (example warmup, sub-queries).
+        
+        Sync wrapper - callers (Streamlit) don't manage an event loop.
+        Without aiohttp installed, falls back to serial query() calls.
+        
+        Args:
+            questions: Questions to send
+            include_kpi: Include structured KPI lookup
+            include_rag: Include semantic RAG retrieval
+            model_key: Optional model configuration key
+            max_concurrency: Max in-flight requests (and pooled connections)
+        
+        Returns:
+            list: One query()-shaped dict per question, same order as input
+        """
+        if aiohttp is None:
+            return [
+                self.query(q, include_kpi, include_rag, model_key)
+                for q in questions
+            ]
+        
+        return asyncio.run(self._gather(
+            questions, include_kpi, include_rag, model_key, max_concurrency
+        ))
+    
+    
+    def query_batch(
+        self,
+        questions: List[str],
+        include_kpi: bool = True,
+        include_rag: bool = True,
+        model_key: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several questions in ONE request to /query_batch.
+        
+        Saves N-1 request/response round-trips versus calling query() N
+        times. Backends without the endpoint (404/405) fall back to
+        query_many().
+        
+        Args:
+            questions: Questions to send (backend accepts 1-10)
+            include_kpi: Include structured KPI lookup
+            include_rag: Include semantic RAG retrieval
+            model_key: Optional model configuration key
+        
+        Returns:
+            list: One query()-shaped dict per question, same order as input
+        """
+        if not self._circuit_allows():
+            return [self._circuit_open_response(q) for q in questions]
+        
+        payload = {
+            "queries": list(questions),
+            "include_kpi": include_kpi,
+            "include_rag": include_rag,
+        }
+        if model_key is not None:
+            payload["model_key"] = model_key
+        
+        try:
+            response = self.session.post(
+                self._batch_url,
+                data=_json_dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=(_CONNECT_TIMEOUT, self.timeout * len(questions))  # served one after another
+            )
+        except requests.exceptions.RequestException as e:
+            # ConnectTimeout is a ConnectionError; read timeouts don't count
+            if isinstance(e, requests.exceptions.ConnectionError):
+                self._record_failure()
+            return [
+                self._error_response(
+                    query=q,
+                    error=f"Batch request failed: {str(e)}",
+                    error_type=type(e).__name__,
+                    stage="http_request"
+                )
+                for q in questions
+            ]
+        
+        status_code = response.status_code
+        self._record_outcome(status_code)
+        
+        # Older backend without the batch endpoint
+        if status_code in (404, 405):
+            return self.query_many(questions, include_kpi, include_rag, model_key)
+        
+        if not 200 <= status_code < 300:
+            return [self._handle_response(response, q) for q in questions]
+        
+        try:
+            items = _json_loads(response.content)["results"]
+        except (ValueError, KeyError, TypeError):
+            items = None
+        
+        if not isinstance(items, list) or len(items) != len(questions):
+            return [
+                self._error_response(
+                    query=q,
+                    error="Backend returned an invalid batch response",
+                    error_type="InvalidJSON",
+                    stage="response_parsing"
+                )
+                for q in questions
+            ]
+        
+        return [self._package_result(item, q) for item, q in zip(items, questions)]
+    
+    
     # ========================================================================
     # PRIVATE HELPER METHODS
     # ========================================================================
     
+    def _compute_timeout(self) -> float:
+        """
+        Adaptive /query read timeout from observed latencies.
+        
+        clamp(2 * P99, self.timeout, _MAX_TIMEOUT). Never shorter than the
+        configured timeout; stretched when the backend's own tail runs
+        longer, up to _MAX_TIMEOUT. Until 32 samples exist, self.timeout.
+        """
+        with self._lock:
+            if len(self._latencies) < 32:
+                return self.timeout
+            ordered = sorted(self._latencies)
+        
+        p99 = ordered[int(0.99 * (len(ordered) - 1))]
+        return min(max(self.timeout, 2.0 * p99), _MAX_TIMEOUT)
+    
+    
+    def _record_latency(self, seconds: float) -> None:
+        """Add one successful round-trip time to the P99 window."""
+        with self._lock:
+            self._latencies.append(seconds)
+    
+    
+    def _circuit_allows(self) -> bool:
+        """
+        Whether a query may go out now.
+        
+        Once the reset window has passed, one probe is let through and the
+        window is re-armed, so other callers keep failing fast until the
+        probe either closes the circuit or re-opens it.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now < self._cb_open_until:
+                return False
+            if self._cb_failures >= self._cb_threshold:
+                self._cb_open_until = now + self._cb_reset  # half-open probe
+            return True
+    
+    
+    def _record_failure(self) -> None:
+        """Count a transport failure; trip the circuit at the threshold."""
+        with self._lock:
+            self._cb_failures += 1
+            if self._cb_failures >= self._cb_threshold:
+                self._cb_open_until = time.monotonic() + self._cb_reset
+    
+    
+    def _record_success(self) -> None:
+        """Backend responded - close the circuit."""
+        with self._lock:
+            self._cb_failures = 0
+            self._cb_open_until = 0.0
+    
+    
+    def _record_outcome(self, status_code: int) -> None:
+        """
+        Feed an HTTP answer to the breaker: retries exhausted on a
+        transient status count as a failure, anything else means the
+        backend is up.
+        """
+        if status_code in _RETRY_STATUSES:
+            self._record_failure()
+        else:
+            self._record_success()
+    
+    
+    def _circuit_open_response(self, question: str) -> Dict[str, Any]:
+        """Fast-fail error while the circuit is open."""
+        with self._lock:
+            open_until = self._cb_open_until
+        wait = max(0.0, open_until - time.monotonic())
+        return self._error_response(
+            query=question,
+            error=f"Backend unavailable after repeated failures - retrying in {wait:.0f}s",
+            error_type="CircuitOpen",
+            stage="client_guard"
+        )
+    
+    
+    async def _gather(
+        self,
+        questions: List[str],
+        include_kpi: bool,
+        include_rag: bool,
+        model_key: Optional[str],
+        max_concurrency: int
+    ) -> List[Dict[str, Any]]:
+        """Run all queries over one aiohttp keep-alive pool."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(limit=max_concurrency, keepalive_timeout=60)
+        
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(*(
+                self._aquery(session, semaphore, question, include_kpi, include_rag, model_key)
+                for question in questions
+            ))
+    
+    
+    async def _aquery(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        question: str,
+        include_kpi: bool,
+        include_rag: bool,
+        model_key: Optional[str]
+    ) -> Dict[str, Any]:
+        """Async mirror of query() - same payload, breaker and response handling."""
+        body = _serialize_payload(question, include_kpi, include_rag, model_key)
+        
+        try:
+            async with semaphore:
+                if not self._circuit_allows():
+                    return self._circuit_open_response(question)
+                async with session.post(
+                    self._query_url,
+                    data=body,
+                    headers=_JSON_HEADERS,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                ) as response:
+                    buffered = _BufferedResponse(response.status, await response.read())
+            
+            self._record_outcome(buffered.status_code)
+            return self._handle_response(buffered, question)
+        
+        except asyncio.TimeoutError:
+            return self._error_response(
+                query=question,
+                error=f"Query timed out after {self.timeout} seconds",
+                error_type="TimeoutError",
+                stage="http_request"
+            )
+        
+        except aiohttp.ClientConnectionError:
+            self._record_failure()
+            return self._error_response(
+                query=question,
+                error=f"Cannot connect to backend at {self.base_url}",
+                error_type="ConnectionError",
+                stage="http_request"
+            )
+        
+        except Exception as e:
+            return self._error_response(
+                query=question,
+                error=f"Unexpected error: {str(e)}",
+                error_type="UnexpectedError",
+                stage="http_request"
+            )
+    
+    
     def _handle_response(
         self, 
         response: requests.Response, 
@@ -251,33 +906,26 @@ class FinSightClient:
         """
         status_code = response.status_code
         
-        # SUCCESS: 2xx responses
-        if 200 <= status_code < 300:
-            return self._handle_success_response(response, question)
-        
-        # CLIENT ERROR: 4xx responses
-        elif 400 <= status_code < 500:
-            return self._handle_client_error(response, question, status_code)
-        
-        # SERVER ERROR: 5xx responses
-        elif 500 <= status_code < 600:
-            return self._handle_server_error(response, question, status_code)
+        # 2xx success / 4xx client error / 5xx server error - one lookup
+        handler = self._status_dispatch.get(status_code // 100)
+        if handler is not None:
+            return handler(response, question, status_code)
         
         # UNEXPECTED: Other status codes
-        else:
-            return self._error_response(
-                query=question,
-                error=f"Unexpected HTTP status code: {status_code}",
-                error_type="UnexpectedStatusCode",
-                stage="http_response",
-                http_status=status_code
-            )
+        return self._error_response(
+            query=question,
+            error=f"Unexpected HTTP status code: {status_code}",
+            error_type="UnexpectedStatusCode",
+            stage="http_response",
+            http_status=status_code
+        )
     
     
     def _handle_success_response(
         self, 
         response: requests.Response,
-        question: str
+        question: str,
+        status_code: int = 200
     ) -> Dict[str, Any]:
         """
         Handle successful 2xx response.
@@ -285,12 +933,13 @@ class FinSightClient:
         Args:
             response: requests.Response object
             question: Original question string
+            status_code: HTTP status code (unused; uniform dispatch signature)
         
         Returns:
             dict: Success response or error if response contains error field
         """
         try:
-            data = response.json()
+            data = _json_loads(response.content)
         except ValueError:
             return self._error_response(
                 query=question,
@@ -299,23 +948,40 @@ class FinSightClient:
                 stage="response_parsing"
             )
         
+        return self._package_result(data, question)
+    
+    
+    def _package_result(self, data: Dict[str, Any], question: str) -> Dict[str, Any]:
+        """
+        Turn one decoded 2xx body (or /query_batch item) into a response dict.
+        
+        Args:
+            data: Decoded JSON object from backend
+            question: Original question string
+        
+        Returns:
+            dict: Success response or error if data contains error field
+        """
         # Check if backend returned error dict (even with 200 status)
         # This handles cases where orchestrator fails but FastAPI returns 200
         if "error" in data:
-            return {
+            response = {
                 "success": False,
                 "query": data.get("query", question),
                 "error": data.get("error"),
                 "error_type": data.get("error_type", "BackendError"),
                 "stage": data.get("stage", "unknown"),
-                "timestamp": data.get("timestamp", datetime.utcnow().isoformat())
             }
+            if "timestamp" in data:
+                response["timestamp"] = data["timestamp"]
+            else:
+                response["timestamp_epoch"] = time.time()
+            return response
         
-        # True success - return data with success flag
-        return {
-            "success": True,
-            **data
-        }
+        # True success - flag the freshly decoded dict in place (no copy of a
+        # possibly tens-of-KB answer/context payload)
+        data["success"] = True
+        return data
     
     
     def _handle_client_error(
@@ -341,7 +1007,7 @@ class FinSightClient:
             dict: Error response
         """
         try:
-            data = response.json()
+            data = _json_loads(response.content)
         except ValueError:
             return self._error_response(
                 query=question,
@@ -405,7 +1071,7 @@ class FinSightClient:
             dict: Error response
         """
         try:
-            data = response.json()
+            data = _json_loads(response.content)
             error_msg = data.get("error", f"Server error: {status_code}")
         except ValueError:
             error_msg = f"Server error: {response.text[:200]}"
@@ -470,12 +1136,46 @@ class FinSightClient:
             "error": error,
             "error_type": error_type,
             "stage": stage,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp_epoch": time.time()  # formatted lazily via error_timestamp()
         }
         
         if http_status is not None:
             response["http_status"] = http_status
         
         return response
+
+
+# ============================================================================
+# SHARED CLIENT
+# ============================================================================
+
+def get_shared_client(
+    base_url: Optional[str] = None,
+    timeout: Optional[int] = None
+) -> FinSightClient:
+    """
+    One FinSightClient per (base_url, timeout) for the whole process.
+    
+    Every page goes through this factory, so they all share a single
+    requests.Session keep-alive pool. Per-page st.cache_resource factories
+    were keyed by function object, giving one pool per page. Only go through
+    this client for backend calls; ad-hoc requests.get/post would bypass
+    the pool.
     
+    Args:
+        base_url: Backend URL (default: config.BACKEND_URL)
+        timeout: Query timeout in seconds (default: config.API_TIMEOUT)
+    """
+    # Resolve defaults before the cache lookup: get_shared_client() and
+    # get_shared_client(BACKEND_URL, API_TIMEOUT) must hit the same entry.
+    return _shared_client(
+        (base_url or BACKEND_URL).rstrip('/'),
+        API_TIMEOUT if timeout is None else timeout
+    )
+
 
+@lru_cache(maxsize=None)
+def _shared_client(base_url: str, timeout: int) -> FinSightClient:
+    client = FinSightClient(base_url=base_url, timeout=timeout, pool_maxsize=16)
+    atexit.register(client.close)  # tear the pool down on server shutdown
+    return client
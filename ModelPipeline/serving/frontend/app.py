@@ -11,9 +11,8 @@ streamlit run .\\serving\\frontend\\app.py
 """
 
 import streamlit as st
-from api_client import FinSightClient
+from api_client import get_shared_client
 from state import init_session_state, auto_check_backend_health
-from config import BACKEND_URL, API_TIMEOUT
 
 # Import styling
 from components.styles import inject_global_css
@@ -45,12 +44,7 @@ init_session_state()
 if "page" not in st.session_state:
     st.session_state.page = "Home"
 
-@st.cache_resource
-def get_api_client():
-    """Get API client instance (singleton)."""
-    return FinSightClient(base_url=BACKEND_URL, timeout=API_TIMEOUT)
-
-client = get_api_client()
+client = get_shared_client()
 
 # auto-check backend health on first load
 auto_check_backend_health(client)
@@ -2,7 +2,7 @@
 """
 RESPONSIBILITIES:
 ✓ Render chat message bubbles (user + assistant)
-✓ Display loading spinner during query processing
+✓ Stream answer text into the assistant bubble as it arrives
 ✓ Show error messages with retry option
 ✓ Handle chat input submission
 
@@ -26,22 +26,35 @@ Usage:
     handle_user_input()
 """
 
+import time
 import streamlit as st
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Tuple
 
 # FIXED: Relative imports (no 'frontend.' prefix)
 from api_client import FinSightClient
 from state import (
-    add_user_message,
-    add_assistant_message,
-    update_metrics
+    make_user_message,
+    make_assistant_message,
+    extend_messages,
+    update_metrics,
+    record_health,
+    clear_chat_history
 )
 from metrics import (
     display_query_metadata,
-    display_error_message
+    display_error_message,
+    refresh_sidebar_stats
 )
 
 
+# Seconds before the backend health badge is considered stale
+_HEALTH_REFRESH_S = 30.0
+
+# Streamed answer redraws: at most every 50 ms, unless 16+ chars are pending
+_FLUSH_INTERVAL_S = 0.05
+_FLUSH_MIN_CHARS = 16
+
+
 def render_chat_message(message: Dict[str, Any]) -> None:
     """
     Render a single chat message (user or assistant).
@@ -68,7 +81,12 @@ def render_chat_message(message: Dict[str, Any]) -> None:
         if role == "assistant" and not message.get("error", False):
             metadata = message.get("metadata")
             if metadata:
-                display_query_metadata(metadata)
+                # History turns build their detail widgets only on demand
+                msg_id = message.get("msg_id")
+                display_query_metadata(
+                    metadata,
+                    lazy_key=None if msg_id is None else f"meta_open_{msg_id}"
+                )
 
 
 
@@ -78,6 +96,10 @@ def render_chat_history() -> None:
     Render all messages in chat history.
     
     Reads from st.session_state.messages and displays each message.
+    
+    Every turn is re-emitted on each script run on purpose: Streamlit drops
+    any element a run does not emit, so skipping "already drawn" turns
+    would blank them. Per-turn cost is kept low instead (see msg_id).
     """
     messages = st.session_state.get("messages", [])
     
@@ -97,74 +119,162 @@ def handle_user_input(client: FinSightClient) -> None:
     # Chat input at bottom of page
     prompt = st.chat_input("Ask a question about SEC 10-K filings...")
     
-    if prompt:
-        # Validate input length (client-side check)
-        if len(prompt) < 10:
-            st.error("[Hey!] Question must be at least 10 characters long.")
-            return
-        
-        # Add user message to history
-        add_user_message(prompt)
+    # Nothing submitted on this run (the common case) - bail out first
+    if not prompt:
+        return
+    
+    # Validate input length (client-side check). A toast is transient -
+    # st.error would add an element to this run's tree for nothing.
+    if len(prompt) < 10:
+        st.toast("[Hey!] Question must be at least 10 characters long.")
+        return
+    
+    # Commit the question before streaming: a rerun mid-stream (new submit,
+    # sidebar click) stops this script at the next slot.markdown, and the
+    # question must still be in history when the page redraws.
+    extend_messages([make_user_message(prompt)])
+    
+    # Display user message immediately. This is its only draw on this run:
+    # render_chat_history() already ran before it entered history.
+    with st.chat_message("user"):
+        st.markdown(prompt)
+    
+    # Refresh a stale health status alongside the query, not after it
+    health_future = None
+    if time.monotonic() - st.session_state.get("_last_health_ts", float("-inf")) > _HEALTH_REFRESH_S:
+        health_future = client.health_check_background(force=True)
+    
+    # Stream the answer into the assistant bubble as it is generated
+    with st.chat_message("assistant"):
+        # Get model_key from session state
+        model_key = st.session_state.get("model_key")
         
-        # Display user message immediately
-        with st.chat_message("user"):
-            st.markdown(prompt)
+        streamed, result = _render_stream(client.query_stream(
+            question=prompt,
+            include_kpi=True,
+            include_rag=True,
+            model_key=model_key
+        ))
         
-        # Process query with loading indicator
-        with st.chat_message("assistant"):
-            with st.spinner("[Searching..!] Processing your question..."):
-                # Get model_key from session state
-                model_key = st.session_state.get("model_key")
-                
-                # Call backend
-                result = client.query(
-                    question=prompt,
-                    include_kpi=True,
-                    include_rag=True,
-                    model_key=model_key
-                )
+        # Handle response
+        if result.get("success"):
+            # Success - answer text is already on screen
+            answer = result.get("answer", "")
+            metadata = result.get("metadata", {})
             
-            # Handle response
-            if result.get("success"):
-                # Success - display answer
-                answer = result.get("answer", "")
-                metadata = result.get("metadata", {})
-                
-                # markdown -- issues? lets attempt.
-                # st.markdown(answer) / st.text, st.write
+            # Non-streaming fallback (older backend) yields no chunks
+            if not streamed:
                 st.markdown(answer)
-                
-                # Add to history
-                add_assistant_message(
-                    content=answer,
-                    metadata=metadata,
-                    error=False
-                )
-                
-                # Update metrics
-                cost = metadata.get("llm", {}).get("cost", 0.0)
-                update_metrics(cost)
-                
-                # Display metadata
-                display_query_metadata(metadata)
             
-            else:
-                # Error - display error message
-                error_msg = result.get("error", "Unknown error occurred")
-                error_type = result.get("error_type", "UnknownError")
-                stage = result.get("stage", "unknown")
-                
-                display_error_message(error_msg, error_type, stage)
-                
-                # Add error to history
-                add_assistant_message(
-                    content=error_msg,
-                    metadata=None,
-                    error=True
-                )
+            assistant_message = make_assistant_message(
+                content=answer,
+                metadata=metadata,
+                error=False
+            )
+            
+            # Update metrics
+            cost = metadata.get("llm", {}).get("cost", 0.0)
+            update_metrics(cost)
+            refresh_sidebar_stats()
+            
+            # Display metadata
+            display_query_metadata(metadata)
         
-        # Rerun to update UI
-        st.rerun()
+        else:
+            # Error - display error message
+            error_msg = result.get("error", "Unknown error occurred")
+            error_type = result.get("error_type", "UnknownError")
+            stage = result.get("stage", "unknown")
+            
+            display_error_message(error_msg, error_type, stage)
+            
+            assistant_message = make_assistant_message(
+                content=error_msg,
+                metadata=None,
+                error=True
+            )
+    
+    # Answer goes into history once the stream has finished. An interrupted
+    # stream leaves the question unanswered and uncounted - its cost only
+    # arrives with the closing result event.
+    extend_messages([assistant_message])
+    
+    if health_future is not None:
+        record_health(health_future.result())
+    
+    # No st.rerun(): both turns are already drawn and committed to
+    # history, and the sidebar counters were redrawn in place above.
+
+
+def _render_stream(stream: Iterator[Any]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Draw client.query_stream() text into one placeholder, coalescing updates.
+    
+    Each flush re-parses the whole buffer as markdown, so chunks are
+    buffered and flushed at most every _FLUSH_INTERVAL_S unless at least
+    _FLUSH_MIN_CHARS new characters are waiting. A caption holds the slot
+    until the first chunk (context building runs before the LLM emits).
+    
+    Returns:
+        (streamed text, closing result dict)
+    """
+    slot = st.empty()
+    slot.caption("[Searching..!] Processing your question...")
+    
+    buf = ""
+    flushed_len = 0
+    last_flush = 0.0
+    result: Dict[str, Any] = {"error": "No response from backend"}
+    
+    for item in stream:
+        if not isinstance(item, str):
+            result = item
+            continue
+        buf += item
+        now = time.monotonic()
+        if now - last_flush >= _FLUSH_INTERVAL_S or len(buf) - flushed_len >= _FLUSH_MIN_CHARS:
+            slot.markdown(buf)
+            flushed_len, last_flush = len(buf), now
+    
+    if not buf:
+        slot.empty()
+    elif flushed_len != len(buf):
+        slot.markdown(buf)
+    
+    return buf, result
+
+
+def add_batch_results(questions: List[str], results: List[Dict[str, Any]]) -> None:
+    """
+    Append a batch of answered questions to chat history.
+    
+    Nothing is rendered here - the caller reruns and render_chat_history()
+    draws the new turns.
+    
+    Args:
+        questions: Questions in the order they were sent
+        results: client.query_batch() results, same order
+    """
+    pending = []
+    for question, result in zip(questions, results):
+        pending.append(make_user_message(question))
+        
+        if result.get("success"):
+            metadata = result.get("metadata", {})
+            pending.append(make_assistant_message(
+                content=result.get("answer", ""),
+                metadata=metadata,
+                error=False
+            ))
+            update_metrics(metadata.get("llm", {}).get("cost", 0.0))
+        else:
+            pending.append(make_assistant_message(
+                content=result.get("error", "Unknown error occurred"),
+                metadata=None,
+                error=True
+            ))
+    
+    extend_messages(pending)
 
 
 def render_clear_button() -> None:
@@ -173,9 +283,6 @@ def render_clear_button() -> None:
     
     Allows users to start a new conversation.
     """
-    #: Relative import
-    from state import clear_chat_history
-    
     if st.sidebar.button("Clear Chat History", use_container_width=True):
         clear_chat_history()
         st.rerun()
\ No newline at end of file
@@ -11,7 +11,8 @@ Usage:
 """
 
 import os
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 
 # ============================================================================
@@ -70,21 +71,26 @@ DEFAULT_SHOW_METADATA: bool = True
 # HELPER FUNCTIONS
 # ============================================================================
 
-def get_config_summary() -> dict:
+# Env vars are fixed for the process lifetime - build the summary once at
+# import instead of on every Streamlit rerun. Read-only view, shared by all.
+_CONFIG_SUMMARY: Mapping[str, object] = MappingProxyType({
+    "backend_url": BACKEND_URL,
+    "api_timeout": API_TIMEOUT,
+    "debug_mode": SHOW_DEBUG_INFO,
+    "environment": "cloud" if os.getenv("BACKEND_URL") else "local"
+})
+
+
+def get_config_summary() -> Mapping[str, object]:
     """
     Get summary of current configuration.
     
     Useful for debugging or displaying in UI.
     
     Returns:
-        dict: Current configuration values
+        Mapping: Current configuration values (read-only; dict(...) to edit)
     """
-    return {
-        "backend_url": BACKEND_URL,
-        "api_timeout": API_TIMEOUT,
-        "debug_mode": SHOW_DEBUG_INFO,
-        "environment": "cloud" if os.getenv("BACKEND_URL") else "local"
-    }
+    return _CONFIG_SUMMARY
 
 
 def print_config() -> None:
@@ -44,7 +44,10 @@ import streamlit as st
 from typing import Dict, Any, Optional
 
 
-def display_query_metadata(metadata: Dict[str, Any]) -> None:
+def display_query_metadata(
+    metadata: Dict[str, Any],
+    lazy_key: Optional[str] = None
+) -> None:
     """
     Display query metadata in an expandable section.
     
@@ -52,65 +55,78 @@ def display_query_metadata(metadata: Dict[str, Any]) -> None:
     
     Args:
         metadata: Metadata dict from backend response
+        lazy_key: Widget key for history turns. When set, a toggle stands in
+                  for the expander and the detail widgets are only built
+                  while it is on - a collapsed st.expander still builds its
+                  whole widget tree on every rerun.
     """
-    with st.expander("[+] Query Details", expanded=False):
-        # Create two columns for better layout
-        col1, col2 = st.columns(2)
-        
-        # Left column: LLM metadata
-        with col1:
-            st.markdown("**[LLM] Information**")
-            
-            llm = metadata.get("llm", {})
-            
-            # Model
-            model_id = llm.get("model_id", "Unknown")
-            # Shorten model ID for display
-            model_display = model_id.split(":")[-1] if ":" in model_id else model_id
-            st.text(f"Model: {model_display}")
-            
-            # Tokens
-            input_tokens = llm.get("input_tokens", 0)
-            output_tokens = llm.get("output_tokens", 0)
-            total_tokens = llm.get("total_tokens", 0)
-            
-            st.text(f"Input Tokens: {input_tokens:,}")
-            st.text(f"Output Tokens: {output_tokens:,}")
-            st.text(f"Total Tokens: {total_tokens:,}")
-            
-            # Cost
-            cost = llm.get("cost", 0.0)
-            st.text(f"Cost: ${cost:.4f}")
-        
-        # Right column: Context metadata
-        with col2:
-            st.markdown("**[Context] Information**")
-            
-            ctx = metadata.get("context", {})
-            
-            # KPI/RAG flags
-            kpi_included = ctx.get("kpi_included", False)
-            rag_included = ctx.get("rag_included", False)
-            
-            kpi_status = "[YES]" if kpi_included else "[NO]"
-            rag_status = "[YES]" if rag_included else "[NO]"
-            
-            st.text(f"KPI Lookup: {kpi_status}")
-            st.text(f"RAG Search: {rag_status}")
-            
-            # Context length
-            context_length = ctx.get("context_length", 0)
-            sentence_count = ctx.get("sentence_count", 0)
-            
-            st.text(f"Context Length: {context_length:,} chars")
-            if sentence_count > 0:
-                st.text(f"Sentences: {sentence_count}")
-        
-        # Processing time (full width at bottom)
-        processing_time_ms = metadata.get("processing_time_ms")
-        if processing_time_ms:
-            st.markdown("---")
-            st.text(f"[TIME] Processing: {processing_time_ms:,.0f}ms ({processing_time_ms/1000:.1f}s)")
+    if lazy_key is None:
+        with st.expander("[+] Query Details", expanded=False):
+            _render_metadata_body(metadata)
+    elif st.toggle("[+] Query Details", key=lazy_key):
+        with st.container(border=True):
+            _render_metadata_body(metadata)
+
+
+def _render_metadata_body(metadata: Dict[str, Any]) -> None:
+    """LLM / context columns + processing time for display_query_metadata."""
+    # Create two columns for better layout
+    col1, col2 = st.columns(2)
+    
+    # Left column: LLM metadata
+    with col1:
+        st.markdown("**[LLM] Information**")
+    
+        llm = metadata.get("llm", {})
+    
+        # Model
+        model_id = llm.get("model_id", "Unknown")
+        # Shorten model ID for display
+        model_display = model_id.split(":")[-1] if ":" in model_id else model_id
+        st.text(f"Model: {model_display}")
+    
+        # Tokens
+        input_tokens = llm.get("input_tokens", 0)
+        output_tokens = llm.get("output_tokens", 0)
+        total_tokens = llm.get("total_tokens", 0)
+    
+        st.text(f"Input Tokens: {input_tokens:,}")
+        st.text(f"Output Tokens: {output_tokens:,}")
+        st.text(f"Total Tokens: {total_tokens:,}")
+    
+        # Cost
+        cost = llm.get("cost", 0.0)
+        st.text(f"Cost: ${cost:.4f}")
+    
+    # Right column: Context metadata
+    with col2:
+        st.markdown("**[Context] Information**")
+    
+        ctx = metadata.get("context", {})
+    
+        # KPI/RAG flags
+        kpi_included = ctx.get("kpi_included", False)
+        rag_included = ctx.get("rag_included", False)
+    
+        kpi_status = "[YES]" if kpi_included else "[NO]"
+        rag_status = "[YES]" if rag_included else "[NO]"
+    
+        st.text(f"KPI Lookup: {kpi_status}")
+        st.text(f"RAG Search: {rag_status}")
+    
+        # Context length
+        context_length = ctx.get("context_length", 0)
+        sentence_count = ctx.get("sentence_count", 0)
+    
+        st.text(f"Context Length: {context_length:,} chars")
+        if sentence_count > 0:
+            st.text(f"Sentences: {sentence_count}")
+    
+    # Processing time (full width at bottom)
+    processing_time_ms = metadata.get("processing_time_ms")
+    if processing_time_ms:
+        st.markdown("---")
+        st.text(f"[TIME] Processing: {processing_time_ms:,.0f}ms ({processing_time_ms/1000:.1f}s)")
 
 
 def display_sidebar_stats() -> None:
@@ -122,22 +138,14 @@ def display_sidebar_stats() -> None:
     """
     st.sidebar.markdown("### [Statistics]")
     
-    # Total queries
-    total_queries = st.session_state.get("total_queries", 0)
-    st.sidebar.metric("Total Queries", total_queries)
-    
-    # Total cost
-    total_cost = st.session_state.get("total_cost", 0.0)
-    st.sidebar.metric("Total Cost", f"${total_cost:.4f}")
-    
-    # Average cost per query
-    if total_queries > 0:
-        avg_cost = total_cost / total_queries
-        st.sidebar.metric("Avg Cost/Query", f"${avg_cost:.4f}")
+    # Counters go in a placeholder so a query handled later in the same
+    # script run can redraw them (see refresh_sidebar_stats) without st.rerun()
+    slot = st.sidebar.empty()
+    st.session_state._stats_slot = slot
+    _draw_counters(slot)
     
     # Backend health indicator
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("### [System Status]")
+    st.sidebar.markdown("---\n### [System Status]")
     
     backend_healthy = st.session_state.get("backend_healthy")
     
@@ -149,6 +157,34 @@ def display_sidebar_stats() -> None:
         st.sidebar.warning("[UNKNOWN] Backend: Not Checked")
 
 
+def refresh_sidebar_stats() -> None:
+    """
+    Redraw the sidebar counters from session_state after update_metrics().
+    
+    No-op if the sidebar has not been drawn in this script run.
+    """
+    slot = st.session_state.get("_stats_slot")
+    if slot is not None:
+        _draw_counters(slot)
+
+
+def _draw_counters(slot) -> None:
+    """Render query count / cost metrics into a st.empty() placeholder."""
+    with slot.container():
+        # Total queries
+        total_queries = st.session_state.get("total_queries", 0)
+        st.metric("Total Queries", total_queries)
+        
+        # Total cost
+        total_cost = st.session_state.get("total_cost", 0.0)
+        st.metric("Total Cost", f"${total_cost:.4f}")
+        
+        # Average cost per query
+        if total_queries > 0:
+            avg_cost = total_cost / total_queries
+            st.metric("Avg Cost/Query", f"${avg_cost:.4f}")
+
+
 def display_error_message(error: str, error_type: str, stage: str) -> None:
     """
     Display error message in a formatted error box.
@@ -21,11 +21,28 @@ if str(parent_dir) not in sys.path:
     sys.path.insert(0, str(parent_dir))
 
 # Now imports should work
-from api_client import FinSightClient
+from api_client import get_shared_client
 from state import init_session_state
 from chat import render_chat_history, handle_user_input
 from sidebar import render_sidebar
-from config import BACKEND_URL, API_TIMEOUT
+
+# ============================================================================
+# STATIC CONTENT
+# ============================================================================
+
+_BEST_RESULTS_MD = """
+**For Best Results:**
+- Mention the **company** and **filing year**
+- Ask about **trends** (margins, revenue, leverage)
+- Phrase questions clearly
+"""
+
+_DISCLOSURE_MD = """
+**Disclosure:**
+- FinSight is a **research tool**, not investment advice
+- Always review original SEC filings
+- Verify critical information independently
+"""
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -45,13 +62,8 @@ st.set_page_config(
 # Initialize session state
 init_session_state()
 
-# Initialize API client (cached)
-@st.cache_resource
-def get_api_client():
-    """Get API client instance (singleton)."""
-    return FinSightClient(base_url=BACKEND_URL, timeout=API_TIMEOUT)
-
-client = get_api_client()
+# Initialize API client (one pooled client shared with every page)
+client = get_shared_client()
 
 # ============================================================================
 # SIDEBAR (SHARED ACROSS ALL PAGES)
@@ -72,20 +84,10 @@ with st.expander("💡 Best Results", expanded=True):
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        **For Best Results:**
-        - Mention the **company** and **filing year**
-        - Ask about **trends** (margins, revenue, leverage)
-        - Phrase questions clearly
-        """)
+        st.markdown(_BEST_RESULTS_MD)
     
     with col2:
-        st.markdown("""
-        **Disclosure:**
-        - FinSight is a **research tool**, not investment advice
-        - Always review original SEC filings
-        - Verify critical information independently
-        """)
+        st.markdown(_DISCLOSURE_MD)
 
 st.markdown("---")
 
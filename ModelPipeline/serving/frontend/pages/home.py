@@ -6,6 +6,109 @@ FinSights Home Page - Polished UI with Streamlit Components.
 import streamlit as st
 
 
+# ============================================================================
+# STATIC CONTENT
+# ============================================================================
+# Page copy lives here, not inline in render_home(), so the function body is
+# only layout. st.markdown dedents its input, so indentation here is free.
+
+_HERO_HTML = """
+<div class="hero-headline">
+    10-Ks shouldn't be barriers. Cut through complexity—
+    <span class="gradient-text">Find Clarity. Find Interpretations. Power your Financial Research.</span>
+</div>
+"""
+
+_HERO_BLURB_MD = """
+Finsights turns raw 10-K filings into a question and answer surface for your research.
+Ask questions, surface KPIs, and trace every answer back to the underlying text in seconds.
+"""
+
+_FEATURE_GRID_HTML = """
+<div class="feature-grid">
+
+  <div class="feature-card">
+    <div class="feature-card-header">
+      <h4>Context-aware Q&amp;A</h4>
+      <i class="fa-solid fa-magnifying-glass feature-icon-inline"></i>
+    </div>
+    <p>
+      Ask questions in plain language and get answers grounded in 10-K text,
+      not generic model memory.
+    </p>
+  </div>
+
+  <div class="feature-card">
+    <div class="feature-card-header">
+      <h4>Section-level insights</h4>
+      <i class="fa-solid fa-file-lines feature-icon-inline"></i>
+    </div>
+    <p>
+      Access Risk Factors, Business Overview, and MD&amp;A, all parsed into
+      clean sections.
+    </p>
+  </div>
+
+  <div class="feature-card">
+    <div class="feature-card-header">
+      <h4>Risk summarization</h4>
+      <i class="fa-solid fa-list-check feature-icon-inline"></i>
+    </div>
+    <p>
+      Generate concise summaries of dense sections tied back to source
+      paragraphs.
+    </p>
+  </div>
+
+  <div class="feature-card">
+    <div class="feature-card-header">
+      <h4>Citation-first answers</h4>
+      <i class="fa-solid fa-quote-left feature-icon-inline"></i>
+    </div>
+    <p>
+      Every response includes filing-level references so you know exactly
+      where information came from.
+    </p>
+  </div>
+
+  <div class="feature-card">
+    <div class="feature-card-header">
+      <h4>Multi-company support</h4>
+      <i class="fa-solid fa-building feature-icon-inline"></i>
+    </div>
+    <p>
+      Ask about any supported filing — Apple 2023, Google 2020,
+      Microsoft 2022.
+    </p>
+  </div>
+
+  <div class="feature-card">
+    <div class="feature-card-header">
+      <h4>Compliance-aware</h4>
+      <i class="fa-solid fa-shield-halved feature-icon-inline"></i>
+    </div>
+    <p>
+      Clear document references support internal review
+      and transparent research.
+    </p>
+  </div>
+
+</div>
+"""
+
+_QUICK_QUERIES_MD = """
+- "What is Google's Revenue for 2023?"
+- "What strategic priorities did Amazon outline?"
+- "Show me Apple's gross margins for 2020-2023"
+"""
+
+_COMPLEX_QUERIES_MD = """
+- "What drove Apple's revenue and margin changes in 2023?"
+- "How did Microsoft's Cloud segment perform vs. last year?"
+- "Compare Netflix and Disney's subscription risks in 2022"
+"""
+
+
 def render_home():
     """Render homepage with polished UI."""
 
@@ -14,24 +117,14 @@ def render_home():
     # =======================================================================
 
     st.markdown(
-        """
-        <div class="hero-headline">
-            10-Ks shouldn't be barriers. Cut through complexity—
-            <span class="gradient-text">Find Clarity. Find Interpretations. Power your Financial Research.</span>
-        </div>
-        """,
+        _HERO_HTML,
         unsafe_allow_html=True,
     )
 
     col_left, col_right = st.columns([3, 2], gap="large")
 
     with col_left:
-        st.markdown(
-            """
-            Finsights turns raw 10-K filings into a question and answer surface for your research.
-            Ask questions, surface KPIs, and trace every answer back to the underlying text in seconds.
-            """
-        )
+        st.markdown(_HERO_BLURB_MD)
 
         if st.button("Try the 10-K chatbot →", type="primary", use_container_width=False):
             st.session_state.page = "Chatbot"
@@ -99,77 +192,7 @@ def render_home():
 
     # Pure HTML: one wrapper + six cards, no Streamlit containers/columns
     st.markdown(
-        """
-        <div class="feature-grid">
-
-          <div class="feature-card">
-            <div class="feature-card-header">
-              <h4>Context-aware Q&amp;A</h4>
-              <i class="fa-solid fa-magnifying-glass feature-icon-inline"></i>
-            </div>
-            <p>
-              Ask questions in plain language and get answers grounded in 10-K text,
-              not generic model memory.
-            </p>
-          </div>
-
-          <div class="feature-card">
-            <div class="feature-card-header">
-              <h4>Section-level insights</h4>
-              <i class="fa-solid fa-file-lines feature-icon-inline"></i>
-            </div>
-            <p>
-              Access Risk Factors, Business Overview, and MD&amp;A, all parsed into
-              clean sections.
-            </p>
-          </div>
-
-          <div class="feature-card">
-            <div class="feature-card-header">
-              <h4>Risk summarization</h4>
-              <i class="fa-solid fa-list-check feature-icon-inline"></i>
-            </div>
-            <p>
-              Generate concise summaries of dense sections tied back to source
-              paragraphs.
-            </p>
-          </div>
-
-          <div class="feature-card">
-            <div class="feature-card-header">
-              <h4>Citation-first answers</h4>
-              <i class="fa-solid fa-quote-left feature-icon-inline"></i>
-            </div>
-            <p>
-              Every response includes filing-level references so you know exactly
-              where information came from.
-            </p>
-          </div>
-
-          <div class="feature-card">
-            <div class="feature-card-header">
-              <h4>Multi-company support</h4>
-              <i class="fa-solid fa-building feature-icon-inline"></i>
-            </div>
-            <p>
-              Ask about any supported filing — Apple 2023, Google 2020,
-              Microsoft 2022.
-            </p>
-          </div>
-
-          <div class="feature-card">
-            <div class="feature-card-header">
-              <h4>Compliance-aware</h4>
-              <i class="fa-solid fa-shield-halved feature-icon-inline"></i>
-            </div>
-            <p>
-              Clear document references support internal review
-              and transparent research.
-            </p>
-          </div>
-
-        </div>
-        """,
+        _FEATURE_GRID_HTML,
         unsafe_allow_html=True,
     )
 
@@ -186,24 +209,12 @@ def render_home():
     with col_q1:
         st.markdown("**Quick Queries:**")
         with st.container(border=True):
-            st.markdown(
-                """
-                - "What is Google's Revenue for 2023?"
-                - "What strategic priorities did Amazon outline?"
-                - "Show me Apple's gross margins for 2020-2023"
-                """
-            )
+            st.markdown(_QUICK_QUERIES_MD)
 
     with col_q2:
         st.markdown("**Complex Analysis:**")
         with st.container(border=True):
-            st.markdown(
-                """
-                - "What drove Apple's revenue and margin changes in 2023?"
-                - "How did Microsoft's Cloud segment perform vs. last year?"
-                - "Compare Netflix and Disney's subscription risks in 2022"
-                """
-            )
+            st.markdown(_COMPLEX_QUERIES_MD)
 
     st.divider()
 
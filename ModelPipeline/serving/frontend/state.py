@@ -16,9 +16,10 @@ RESPONSIBILITIES:
 STATE SCHEMA:
 {
     "messages": [
-        {"role": "user", "content": str, "timestamp": str},
-        {"role": "assistant", "content": str, "metadata": dict}
+        {"msg_id": int, "role": "user", "content": str, "timestamp": str},
+        {"msg_id": int, "role": "assistant", "content": str, "metadata": dict}
     ],
+    "next_msg_id": int,
     "total_queries": int,
     "total_cost": float,
     "backend_healthy": bool
@@ -43,9 +44,10 @@ Usage:
     add_user_message("What was Apple's revenue?")
 """
 
+import time
 import streamlit as st
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 def init_session_state():
@@ -59,6 +61,10 @@ def init_session_state():
     if "messages" not in st.session_state:
         st.session_state.messages = []
     
+    # Monotonic message id (stable widget keys per turn)
+    if "next_msg_id" not in st.session_state:
+        st.session_state.next_msg_id = 0
+    
     # Metrics tracking
     if "total_queries" not in st.session_state:
         st.session_state.total_queries = 0
@@ -78,28 +84,35 @@ def init_session_state():
         st.session_state.model_key = None  # Use backend default
 
 
-def add_user_message(content: str) -> None:
+def _new_message_id() -> int:
+    """Hand out the next message id (never reused within a session)."""
+    msg_id = st.session_state.next_msg_id
+    st.session_state.next_msg_id = msg_id + 1
+    return msg_id
+
+
+def make_user_message(content: str) -> Dict[str, Any]:
     """
-    Add user message to chat history.
+    Build a user message dict (not yet in history - see extend_messages).
     
     Args:
         content: User's question text
     """
-    message = {
+    return {
+        "msg_id": _new_message_id(),
         "role": "user",
         "content": content,
         "timestamp": datetime.utcnow().isoformat()
     }
-    st.session_state.messages.append(message)
 
 
-def add_assistant_message(
+def make_assistant_message(
     content: str,
     metadata: Optional[Dict[str, Any]] = None,
     error: bool = False
-) -> None:
+) -> Dict[str, Any]:
     """
-    Add assistant message to chat history.
+    Build an assistant message dict (not yet in history - see extend_messages).
     
     Args:
         content: Assistant's response text (answer or error message)
@@ -107,6 +120,7 @@ def add_assistant_message(
         error: Whether this is an error message
     """
     message = {
+        "msg_id": _new_message_id(),
         "role": "assistant",
         "content": content,
         "timestamp": datetime.utcnow().isoformat(),
@@ -116,7 +130,43 @@ def add_assistant_message(
     if metadata is not None:
         message["metadata"] = metadata
     
-    st.session_state.messages.append(message)
+    return message
+
+
+def extend_messages(pending: List[Dict[str, Any]]) -> None:
+    """
+    Commit several finished messages to chat history in one mutation.
+    
+    Args:
+        pending: Messages from make_user_message / make_assistant_message
+    """
+    st.session_state.messages.extend(pending)
+
+
+def add_user_message(content: str) -> None:
+    """
+    Add user message to chat history.
+    
+    Args:
+        content: User's question text
+    """
+    st.session_state.messages.append(make_user_message(content))
+
+
+def add_assistant_message(
+    content: str,
+    metadata: Optional[Dict[str, Any]] = None,
+    error: bool = False
+) -> None:
+    """
+    Add assistant message to chat history.
+    
+    Args:
+        content: Assistant's response text (answer or error message)
+        metadata: Optional metadata dict from backend
+        error: Whether this is an error message
+    """
+    st.session_state.messages.append(make_assistant_message(content, metadata, error))
 
 
 def update_metrics(cost: float) -> None:
@@ -191,6 +241,47 @@ def get_backend_health() -> Optional[bool]:
 
 
 
+def record_health(health: Dict[str, Any]) -> None:
+    """
+    Store a client.health_check() result for the sidebar status badge.
+    
+    Also stamps _last_health_ts, which chat.handle_user_input uses to decide
+    whether a background re-check is due - so every check, manual or
+    automatic, postpones the next one.
+    
+    Args:
+        health: health_check() response dict
+    """
+    healthy = health.get("status") == "healthy"
+    st.session_state.backend_healthy = healthy
+    st.session_state.backend_error = None if healthy else health.get("error", "Unknown error")
+    st.session_state._last_health_ts = time.monotonic()
+    st.session_state._health_future = None  # any in-flight check is now older
+
+
+def refresh_health_if_stale(client, max_age: float) -> None:
+    """
+    Keep the backend status self-healing without blocking a rerun.
+    
+    When the last recorded check is older than max_age, start a background
+    health check; a later rerun that finds it finished records the result.
+    At most one check is in flight per session.
+    
+    Args:
+        client: FinSightClient instance
+        max_age: Seconds before the recorded status counts as stale
+    """
+    pending = st.session_state.get("_health_future")
+    if pending is not None:
+        if pending.done():
+            st.session_state._health_future = None
+            record_health(pending.result())
+        return
+    
+    if time.monotonic() - st.session_state.get("_last_health_ts", float("-inf")) > max_age:
+        st.session_state._health_future = client.health_check_background()
+
+
 def auto_check_backend_health(client, show_spinner: bool = False) -> None:
     """
     Automatically check backend health on first app load.
@@ -206,12 +297,7 @@ def auto_check_backend_health(client, show_spinner: bool = False) -> None:
         else:
             health = client.health_check()
         
-        if health.get("status") == "healthy":
-            st.session_state.backend_healthy = True
-        else:
-            st.session_state.backend_healthy = False
-            st.session_state.backend_error = health.get("error", "Unknown error")
-        
+        record_health(health)
         st.session_state.backend_auto_checked = True
 
         
\ No newline at end of file
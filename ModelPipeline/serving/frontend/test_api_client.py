@@ -4,23 +4,36 @@ Quick test for api_client.py
 Run with backend running in Terminal 1
 """
 
+import time
+
+import pytest
+
 from frontend.api_client import FinSightClient
 
-def test_health_check():
+# Run from ModelPipeline/serving; pytest.ini there adds xdist (-n 3) so the
+# network-bound tests run side by side:
+#   python -m pytest            (or: python -m frontend.test_api_client)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One client (one keep-alive pool) per xdist worker."""
+    with FinSightClient() as shared:
+        yield shared
+
+
+def test_health_check(client: FinSightClient):
     """Test backend health check."""
     print("\n=== Testing Health Check ===")
-    client = FinSightClient()
     health = client.health_check()
     print(f"Status: {health.get('status')}")
     print(f"Full response: {health}")
-    return health.get('status') == 'healthy'
+    assert health.get('status') == 'healthy', health
 
 
-def test_query_success():
+def test_query_success(client: FinSightClient):
     """Test successful query."""
     print("\n=== Testing Successful Query ===")
-    client = FinSightClient()
-    
     result = client.query(
         question="What was Apple's revenue in 2017?",
         include_kpi=True,
@@ -38,15 +51,56 @@ def test_query_success():
         print(f"Error: {result.get('error')}")
         print(f"Stage: {result.get('stage')}")
     
-    return result.get('success')
+    assert result.get('success'), f"{result.get('stage')}: {result.get('error')}"
+
 
 
+def test_query_stream(client: FinSightClient):
+    """Test streamed query: chunks first, result dict last."""
+    print("\n=== Testing Streamed Query ===")
+    t0 = time.monotonic()
+    first_chunk = None
+    chunks = []
+    result = {}
+    
+    for item in client.query_stream(question="What was Apple's revenue in 2017?"):
+        if isinstance(item, str):
+            if first_chunk is None:
+                first_chunk = time.monotonic() - t0
+            chunks.append(item)
+        else:
+            result = item
+    
+    total = time.monotonic() - t0
+    print(f"Success: {result.get('success')}")
+    print(f"Chunks: {len(chunks)}, first after {first_chunk or 0:.2f}s, done after {total:.2f}s")
+    
+    # Streamed text must add up to the final answer
+    assert result.get('success'), f"{result.get('stage')}: {result.get('error')}"
+    assert "".join(chunks) == result.get('answer')
+
+
+def test_query_batch(client: FinSightClient):
+    """Test several questions in one /query_batch round-trip."""
+    print("\n=== Testing Batch Query ===")
+    questions = [
+        "What was Apple's revenue in 2017?",
+        "What was Microsoft's net income in 2018?",
+    ]
+    
+    results = client.query_batch(questions)
+    
+    for question, result in zip(questions, results):
+        status = "ok" if result.get('success') else f"error: {result.get('error')}"
+        print(f"  {question[:40]}... → {status}")
+    
+    assert len(results) == len(questions)
+    assert all(r.get('success') for r in results), results
+
 
-def test_query_validation():
+def test_query_validation(client: FinSightClient):
     """Test query with invalid input (too short)."""
     print("\n=== Testing Validation Error ===")
-    client = FinSightClient()
-    
     result = client.query(question="Hi")  # Too short, should fail
     
     print(f"Success: {result.get('success')}")
@@ -65,29 +119,12 @@ def test_query_validation():
         print(f"  Query: {result.get('query')}")
         print(f"  Answer: {result.get('answer', '')[:100]}...")
     
-    return not result.get('success')  # Should fail (success=False means PASS)
+    assert not result.get('success'), "backend accepted a too-short query"
 
 
 if __name__ == "__main__":
-    print("=" * 60)
-    print("API Client Tests")
-    print("=" * 60)
-    print("Make sure backend is running on http://localhost:8000")
-    print("=" * 60)
-    
-    results = {
-        "Health Check": test_health_check(),
-        "Successful Query": test_query_success(),
-        "Validation Error": test_query_validation()
-    }
-    
-    print("\n" + "=" * 60)
-    print("Test Summary")
-    print("=" * 60)
-    for test_name, passed in results.items():
-        status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status} - {test_name}")
-
+    # Make sure backend is running on http://localhost:8000
+    raise SystemExit(pytest.main([__file__, "-n", "3"]))
 
 
 """
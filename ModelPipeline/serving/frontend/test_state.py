@@ -9,6 +9,9 @@ from frontend.state import (
     init_session_state,
     add_user_message,
     add_assistant_message,
+    make_user_message,
+    make_assistant_message,
+    extend_messages,
     update_metrics,
     get_message_count,
     clear_chat_history
@@ -59,6 +62,21 @@ def test_add_messages():
     print(f"✅ Added 2 messages, count: {len(st.session_state.messages)}")
     return True
 
+def test_extend_messages():
+    """Test committing a turn pair in one write."""
+    print("\n=== Testing Extend Messages ===")
+    
+    pending = [make_user_message("Batched question"), make_assistant_message("Batched answer")]
+    assert len(st.session_state.messages) == 2  # built, not yet committed
+    
+    extend_messages(pending)
+    
+    assert len(st.session_state.messages) == 4
+    ids = [msg["msg_id"] for msg in st.session_state.messages]
+    assert ids == sorted(set(ids))
+    print(f"✅ Extended to {len(st.session_state.messages)} messages, ids: {ids}")
+    return True
+
 def test_metrics():
     """Test metrics tracking."""
     print("\n=== Testing Metrics ===")
@@ -91,6 +109,7 @@ if __name__ == "__main__":
     results = {
         "Initialization": test_initialization(),
         "Add Messages": test_add_messages(),
+        "Extend Messages": test_extend_messages(),
         "Metrics Tracking": test_metrics(),
         "Clear History": test_clear()
     }